@@ -0,0 +1,233 @@
+"""
+x402 Protocol Pioneer Animation Timeline
+Declarative keyframe timelines for the tier animations. A loop is split
+into named phases, and each layer (request code, logo, streaks...) lists
+the properties it has in the phases it is visible in: constants, or
+Tracks keyframed in phase progress (0 at the phase's first frame, 1 at
+its end).
+
+TimelineRenderer draws the visible layers bottom to top. After a layer
+whose properties match the previous frame's it snapshots the frame, keyed
+by the properties of every layer so far; a frame starts from the deepest
+snapshot whose layers are all unchanged. So only the layers that changed
+(and those stacked above them) are redrawn: static layers are drawn once,
+and a frame where nothing moved is a copy. Redrawing everything above a
+changed layer, in order, keeps frames identical to drawing them from
+scratch.
+
+Blend layers draw translucent effects onto a FrameCompositor instead of
+the frame; adjacent ones share it, so the frame is converted to RGBA and
+back once per run of them. A layer with an update function (typed text)
+keeps its output from the previous frame and, while the layers under it
+are unchanged, updates that instead of drawing from scratch.
+
+Usage:
+    timeline = Timeline([('intro', 0, 30), ('hold', 30, 50)])
+    timeline.add(Layer('title', draw_title, intro={'alpha': Track((0, 0), (1, 255), cast=int)},
+                       hold={'alpha': 255}))
+    renderer = TimelineRenderer(timeline, lambda: Image.new('RGB', (512, 512)))
+    img = renderer.render(12)
+"""
+
+from collections import OrderedDict
+
+from frame_compositor import FrameCompositor
+from render_profile import section
+
+# Frame snapshots a renderer keeps (static layers stay hot, per-frame ones cycle)
+SNAPSHOT_CACHE_SIZE = 8
+
+
+class Track:
+    """
+    A property animated between keyframes (phase progress, value)
+    Values hold before the first keyframe and after the last. Linear
+    segments are evaluated as v0 + (p - p0) * (v1 - v0) / (p1 - p0), the
+    arithmetic of the hand-written curves they replaced; ease maps a
+    segment's 0..1 position to an eased one. cast (e.g. int) is applied
+    to the result.
+    """
+
+    def __init__(self, *keyframes, ease=None, cast=None):
+        if not keyframes:
+            raise ValueError("A track needs at least one keyframe")
+        self.keyframes = sorted(keyframes)
+        self.ease = ease
+        self.cast = cast
+
+    def __call__(self, progress):
+        first_progress, value = self.keyframes[0]
+        if progress > first_progress:
+            value = self.keyframes[-1][1]
+            for (p0, v0), (p1, v1) in zip(self.keyframes, self.keyframes[1:]):
+                if progress < p1:
+                    if self.ease is None:
+                        value = v0 + (progress - p0) * (v1 - v0) / (p1 - p0)
+                    else:
+                        value = v0 + self.ease((progress - p0) / (p1 - p0)) * (v1 - v0)
+                    break
+        return self.cast(value) if self.cast is not None else value
+
+
+def _evaluate(value, progress):
+    """A property value at progress: Tracks are evaluated, tuples element-wise"""
+    if isinstance(value, Track):
+        return value(progress)
+    if isinstance(value, tuple):
+        return tuple(_evaluate(item, progress) for item in value)
+    return value
+
+
+class Layer:
+    """
+    A named layer drawn by draw(img, **properties) -> img (img itself,
+    drawn on, or a new image), or with blend=True by draw(compositor,
+    **properties) onto a FrameCompositor over the frame
+    update(img, below, previous, **properties) -> bool, if given, brings
+    img - the layer drawn over below with the previous properties (a dict)
+    - up to date in place, exactly as draw would; it returns False, without
+    touching img, when it cannot.
+    Keyword arguments map phase names to the layer's properties in that
+    phase; the layer is hidden in phases it does not list.
+    """
+
+    def __init__(self, name, draw, blend=False, update=None, **phases):
+        self.name = name
+        self.draw = draw
+        self.blend = blend
+        self.update = update
+        self.phases = phases
+
+    def properties(self, phase, progress):
+        """Sorted (name, value) pairs of the properties at phase progress, or None if hidden"""
+        properties = self.phases.get(phase)
+        if properties is None:
+            return None
+        return tuple(sorted((name, _evaluate(value, progress)) for name, value in properties.items()))
+
+
+class Timeline:
+    """Contiguous phases (name, first frame, end frame) and layers, bottom first"""
+
+    def __init__(self, phases):
+        self.phases = phases
+        self.length = phases[-1][2]
+        self.layers = []
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def phase(self, frame):
+        """(phase name, progress) of a frame; frames wrap around the loop"""
+        frame %= self.length
+        for name, start, end in self.phases:
+            if frame < end:
+                return name, (frame - start) / (end - start)
+        raise ValueError(f"Frame {frame} is outside the timeline")
+
+    def state(self, frame):
+        """Properties of every layer at frame (None for hidden layers)"""
+        phase, progress = self.phase(frame)
+        return [layer.properties(phase, progress) for layer in self.layers]
+
+
+class TimelineRenderer:
+    """Render a timeline's frames, redrawing only from the lowest changed layer up"""
+
+    def __init__(self, timeline, new_canvas, cache_size=SNAPSHOT_CACHE_SIZE):
+        self.timeline = timeline
+        self.new_canvas = new_canvas
+        self.cache_size = cache_size
+        # Properties of layers 0..i -> frame after layer i (never drawn on)
+        self.snapshots = OrderedDict()
+        self.previous = None
+        # Layer index -> (properties of the layers under it, its properties, its output) last drawn
+        self.outputs = {}
+
+    def _snapshot(self, key):
+        img = self.snapshots.get(key)
+        if img is not None:
+            self.snapshots.move_to_end(key)
+        return img
+
+    def _store(self, key, img):
+        self.snapshots[key] = img
+        if len(self.snapshots) > self.cache_size:
+            self.snapshots.popitem(last=False)
+
+    def render(self, frame):
+        """A new image of frame"""
+        state = self.timeline.state(frame)
+        layers = self.timeline.layers
+        keys = [tuple(state[:index + 1]) for index in range(len(state))]
+
+        # Leading layers unchanged since the previous frame are likely static: only they are snapshotted
+        stable = 0
+        if self.previous is not None:
+            while stable < len(state) and state[stable] == self.previous[stable]:
+                stable += 1
+        self.previous = state
+
+        # Deepest snapshot whose layers all match this frame
+        start, img = 0, None
+        for index in range(len(keys) - 1, -1, -1):
+            img = self._snapshot(keys[index])
+            if img is not None:
+                start = index + 1
+                break
+        owned = img is None
+        if owned:
+            img = self.new_canvas()
+
+        visible = [index for index in range(start, len(state)) if state[index] is not None]
+        compositor = None
+        for position, index in enumerate(visible):
+            layer = layers[index]
+            with section(layer.name):
+                if layer.blend:
+                    compositor = compositor or FrameCompositor(img)
+                    layer.draw(compositor, **dict(state[index]))
+                elif layer.update is not None:
+                    img = self._draw_or_update(index, keys, state, img, owned)
+                    owned = False  # Kept for the next frame's update
+                else:
+                    if not owned:
+                        img = img.copy()
+                    img = layer.draw(img, **dict(state[index]))
+                    owned = True
+
+            if compositor is not None:
+                if position + 1 < len(visible) and layers[visible[position + 1]].blend:
+                    continue
+                with section('composite'):
+                    img = compositor.to_rgb()
+                compositor = None
+                owned = True
+
+            if index < stable:
+                # Updatable outputs change in place, so their snapshots are copies
+                self._store(keys[index], img.copy() if layer.update is not None else img)
+                owned = False
+
+        return img if owned else img.copy()
+
+    def _draw_or_update(self, index, keys, state, below, owned):
+        """Output of an updatable layer: its previous output brought up to date, or drawn afresh"""
+        layer = self.timeline.layers[index]
+        below_key = keys[index - 1] if index else ()
+        properties = dict(state[index])
+
+        last = self.outputs.get(index)
+        if last is not None and last[0] == below_key and layer.update(last[2], below, dict(last[1]), **properties):
+            img = last[2]
+        else:
+            img = layer.draw(below if owned else below.copy(), **properties)
+        self.outputs[index] = (below_key, state[index], img)
+        return img
+
+    def clear(self):
+        """Forget every snapshot"""
+        self.snapshots.clear()
+        self.previous = None
+        self.outputs.clear()
@@ -0,0 +1,261 @@
+"""
+x402 Protocol Pioneer Asset Benchmarks
+Timing, output size and peak memory for every stage of the asset pipeline,
+compared against a JSON history so that a slowdown or a size regression
+fails the run.
+
+Each case runs in a fresh interpreter (so its peak RSS is its own), is
+warmed up once (fonts, sprites and frame layers are per-process caches) and
+then timed over several rounds; the best round counts. The baseline for a
+case is the median of its recent passing runs in the history file, since
+the last run accepted as a new baseline (after an intended change).
+
+Usage:
+    import asset_benchmarks
+    results = asset_benchmarks.run_cases(asset_benchmarks.select_cases())
+"""
+
+import contextlib
+import fnmatch
+import io
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from memory_budget import peak_rss_kb
+
+HISTORY_FILE = ".benchmark-history.json"
+HISTORY_VERSION = 1
+
+# Regression thresholds: a case fails if it is this much worse than its baseline
+TIME_THRESHOLD = 0.25       # 25% slower...
+TIME_MIN_DELTA = 0.002      # ...and at least 2ms slower (timer noise on tiny cases)
+SIZE_THRESHOLD = 0.02       # 2% more output bytes
+RSS_THRESHOLD = 0.25        # 25% more peak RSS
+
+# Recent passing runs the baseline is the median of
+BASELINE_RUNS = 5
+
+# First and end frame of each timeline phase (see tier_animation.PHASES)
+PHASE_FRAMES = {
+    'typing': (0, 30),
+    'fade': (30, 45),
+    'response': (45, 65),
+    'pause': (65, 75),
+    'shooting': (75, 100)
+}
+
+# Tier whose phases are timed (the gold border makes it the busiest)
+PHASE_TIER = 'genesis'
+
+# name: benchmark case, run: run(arg, work_dir) -> output bytes or None, rounds: timed runs
+BenchmarkCase = namedtuple('BenchmarkCase', 'name run arg rounds')
+
+
+def png_size(img):
+    """Encoded PNG size of an image, as the asset would be written"""
+    buf = io.BytesIO()
+    img.save(buf, 'PNG')
+    return buf.tell()
+
+
+def _draw_phase(frames, work_dir):
+    from tier_animation import clear_frame_cache, draw_frame, tiers
+    # Frames reuse the layers cached by earlier ones, so time the whole phase in order
+    clear_frame_cache()
+    for frame in range(*frames):
+        draw_frame(tiers[PHASE_TIER], frame)
+    return None
+
+
+def _generate_gif(tier_name, work_dir):
+    from tier_animation import generate_gif, tiers
+    return os.path.getsize(generate_gif(tier_name, tiers[tier_name], output_dir=work_dir))
+
+
+def _create_static_nft(tier_name, work_dir):
+    from tier_image import create_static_nft, tiers
+    return png_size(create_static_nft(tiers[tier_name], tier_name))
+
+
+def _create_logo_square(size, work_dir):
+    from brand_assets import create_logo_square
+    return png_size(create_logo_square(size))
+
+
+def _logo_pyramid(sizes, work_dir):
+    from brand_assets import logo_pyramid
+    return sum(png_size(logo) for logo in logo_pyramid(sizes).values())
+
+
+def _collection_banner(_, work_dir):
+    from collection_banner import create_collection_banner
+    return png_size(create_collection_banner())
+
+
+def _brand_banner(_, work_dir):
+    from brand_assets import create_collection_banner
+    return png_size(create_collection_banner())
+
+
+def benchmark_cases():
+    """Every benchmark case, in pipeline order"""
+    # Tier names and logo sizes are literals here so that listing cases stays Pillow-free
+    tier_names = ['protocol-user', 'early-adopter', 'pioneer', 'genesis']
+    logo_sizes = [512, 315, 256, 220, 180, 128, 64, 32]
+
+    cases = [BenchmarkCase(f"draw_phase/{phase}", _draw_phase, frames, 5) for phase, frames in PHASE_FRAMES.items()]
+    cases += [BenchmarkCase(f"generate_gif/{tier}", _generate_gif, tier, 2) for tier in tier_names]
+    cases += [BenchmarkCase(f"create_static_nft/{tier}", _create_static_nft, tier, 5) for tier in tier_names]
+    cases += [BenchmarkCase(f"create_logo_square/{size}", _create_logo_square, size, 10) for size in logo_sizes]
+    cases += [
+        BenchmarkCase("logo_pyramid/all", _logo_pyramid, tuple(logo_sizes), 3),
+        BenchmarkCase("banner/collection", _collection_banner, None, 3),
+        BenchmarkCase("banner/brand", _brand_banner, None, 5)
+    ]
+    return cases
+
+
+def select_cases(patterns=None):
+    """Cases whose names match any of the glob patterns (default: all)"""
+    cases = benchmark_cases()
+    if not patterns:
+        return cases
+    return [case for case in cases if any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns)]
+
+
+def measure_case(name, rounds=None):
+    """Run one case in this process: {'seconds', 'median_seconds', 'bytes', 'peak_rss_kb'}"""
+    case = next(case for case in benchmark_cases() if case.name == name)
+    rounds = rounds or case.rounds
+
+    with tempfile.TemporaryDirectory(prefix="asset-bench-") as work_dir:
+        # Generators report progress on stdout; keep the benchmark output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            output_bytes = case.run(case.arg, work_dir)  # Warm-up: fonts, sprites, frame layers
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                case.run(case.arg, work_dir)
+                timings.append(time.perf_counter() - start)
+
+    return {
+        'seconds': min(timings),
+        'median_seconds': statistics.median(timings),
+        'bytes': output_bytes,
+        'peak_rss_kb': peak_rss_kb()
+    }
+
+
+def run_cases(cases, rounds=None, isolate=True, progress=None):
+    """Measure cases, each in a fresh interpreter unless isolate=False
+
+    progress(case, result) is called after each case. Returns {name: result}.
+    """
+    results = {}
+    for case in cases:
+        if isolate:
+            # A fresh single-worker pool per case, so the peak RSS belongs to this case alone
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                result = executor.submit(measure_case, case.name, rounds).result()
+        else:
+            result = measure_case(case.name, rounds)
+        results[case.name] = result
+        if progress is not None:
+            progress(case, result)
+    return results
+
+
+def environment():
+    """What the numbers were measured on (history runs are only comparable on the same)"""
+    try:
+        from PIL import __version__ as pillow_version
+    except ImportError:
+        pillow_version = None
+    return {
+        'python': platform.python_version(),
+        'pillow': pillow_version,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count()
+    }
+
+
+class BenchmarkHistory:
+    """Past benchmark runs, stored as JSON"""
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.runs = []
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get('version') == HISTORY_VERSION:
+                    self.runs = data.get('runs', [])
+            except (OSError, ValueError):
+                self.runs = []
+
+    def baseline(self, name, env, runs=BASELINE_RUNS):
+        """Median of a case's recent passing results on the same environment, or None"""
+        previous = []
+        for run in self.runs:
+            if run.get('environment') != env or name not in run['results']:
+                continue
+            if run.get('accepted'):
+                # An accepted run replaces the baseline: older results no longer count
+                previous = []
+            if run.get('passed'):
+                previous.append(run['results'][name])
+        previous = previous[-runs:]
+        if not previous:
+            return None
+
+        baseline = {}
+        for key in ('seconds', 'bytes', 'peak_rss_kb'):
+            values = [result[key] for result in previous if result.get(key) is not None]
+            baseline[key] = statistics.median(values) if values else None
+        return baseline
+
+    def record(self, results, env, passed, accepted=False):
+        """Add a run; an accepted run (passed) starts a new baseline for its cases"""
+        self.runs.append({
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'environment': env,
+            'passed': passed or accepted,
+            'accepted': accepted,
+            'results': results
+        })
+
+    def save(self):
+        """Write the history atomically"""
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'version': HISTORY_VERSION, 'runs': self.runs}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def regressions(result, baseline, time_threshold=TIME_THRESHOLD, size_threshold=SIZE_THRESHOLD,
+                rss_threshold=RSS_THRESHOLD):
+    """Human-readable regressions of result against baseline (empty if none)"""
+    if baseline is None:
+        return []
+
+    found = []
+    seconds, base_seconds = result['seconds'], baseline.get('seconds')
+    if base_seconds and seconds > base_seconds * (1 + time_threshold) and seconds - base_seconds > TIME_MIN_DELTA:
+        found.append(f"time {base_seconds * 1000:.1f}ms -> {seconds * 1000:.1f}ms")
+
+    size, base_size = result.get('bytes'), baseline.get('bytes')
+    if size is not None and base_size and size > base_size * (1 + size_threshold):
+        found.append(f"size {base_size:.0f}B -> {size}B")
+
+    rss, base_rss = result.get('peak_rss_kb'), baseline.get('peak_rss_kb')
+    if rss is not None and base_rss and rss > base_rss * (1 + rss_threshold):
+        found.append(f"peak RSS {base_rss / 1024:.0f}MB -> {rss / 1024:.0f}MB")
+
+    return found
@@ -0,0 +1,104 @@
+"""
+x402 Protocol Pioneer Asset Library
+In-process batch entry point for building the collection assets. Each asset
+group is rendered by a side-effect-free module (collection_banner,
+tier_animation, tier_image), imported on first use, so one build pays for
+interpreter start-up, the Pillow import and the font/sprite caches once
+instead of once per generator script.
+
+Usage:
+    import asset_library
+    asset_library.build_assets()                        # everything, default dirs
+    asset_library.build_group('animations', ['genesis'], output_dir='/tmp/out')
+
+Pass a memory_budget.MemoryTracker to record each asset's peak memory and,
+if it has a budget, to pick render settings that stay under it.
+"""
+
+import os
+from collections import namedtuple
+
+from memory_budget import MemoryTracker, describe_plan
+
+# module: renderer module name, output_dir: default directory,
+# outputs: file names per tier ('{tier}' is filled in),
+# build: builder function(tier names, output dir, workers, memory tracker)
+AssetGroup = namedtuple('AssetGroup', 'module description output_dir outputs build')
+
+LIBRARY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _build_banner(tier_names, output_dir, workers, memory):
+    from collection_banner import generate_banner
+    with memory.track("collection-banner.png"):
+        return [generate_banner(output_dir)]
+
+
+def _build_animations(tier_names, output_dir, workers, memory):
+    from tier_animation import generate_gif, tiers
+    paths = []
+    for tier_name in (tier_names or tiers):
+        plan = memory.plan_animation(workers)
+        if memory.budget is not None:
+            print(describe_plan(plan))
+        with memory.track(f"{tier_name}.gif", plan.workers):
+            paths.append(generate_gif(tier_name, tiers[tier_name], plan.workers, plan.stream, output_dir))
+    return paths
+
+
+def _build_images(tier_names, output_dir, workers, memory):
+    from tier_image import generate_png, tiers
+    paths = []
+    for tier_name in (tier_names or tiers):
+        with memory.track(f"{tier_name}.png/.svg"):
+            paths.extend(generate_png(tier_name, tiers[tier_name], output_dir))
+    return paths
+
+
+ASSET_GROUPS = {
+    'banner': AssetGroup(
+        'collection_banner', "collection banner", "public/images",
+        ["collection-banner.png"], _build_banner
+    ),
+    'animations': AssetGroup(
+        'tier_animation', "GIF animations", "public/animations",
+        ["{tier}.gif"], _build_animations
+    ),
+    'images': AssetGroup(
+        'tier_image', "PNG static images", "public/images",
+        ["{tier}.png", "{tier}.svg"], _build_images
+    )
+}
+
+
+def module_path(group):
+    """Source file of a group's renderer module (without importing it)"""
+    return os.path.join(LIBRARY_DIR, f"{ASSET_GROUPS[group].module}.py")
+
+
+def build_group(group, tier_names=None, output_dir=None, workers=1, memory=None):
+    """Render one asset group in this process, returning the paths written
+
+    tier_names limits tiered groups to some tiers (default: all); groups
+    without tiers ignore it.
+    """
+    spec = ASSET_GROUPS[group]
+    memory = memory or MemoryTracker()
+
+    tile_pixels = memory.gradient_tile_pixels()
+    if tile_pixels is None:
+        return spec.build(tier_names, output_dir or spec.output_dir, workers, memory)
+
+    # Smaller gradient tiles for this build only
+    from gradients import tile_limit
+    with tile_limit(tile_pixels):
+        return spec.build(tier_names, output_dir or spec.output_dir, workers, memory)
+
+
+def build_assets(groups=None, workers=1, memory=None):
+    """Render every asset group (or the named ones) to their default directories
+
+    Returns {group: [paths written]}.
+    """
+    memory = memory or MemoryTracker()
+    return {group: build_group(group, workers=workers, memory=memory) for group in (groups or ASSET_GROUPS)}
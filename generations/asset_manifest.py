@@ -0,0 +1,184 @@
+"""
+x402 Protocol Pioneer Asset Manifest
+Content-hash manifest for incremental asset builds. Every output file records
+a hash of its inputs - the renderer source and the local helper modules it
+imports, its tier configuration, the bytes of every font file the renderers
+resolve (font_registry.FONT_FAMILIES) and the Pillow version - plus a hash of
+the bytes on disk. An output is rebuilt only when its inputs change or the
+file no longer matches, and a rebuilt file replaces the old one only if its
+bytes actually differ, so unchanged files keep their mtime.
+"""
+
+import ast
+import hashlib
+import json
+import os
+
+MANIFEST_FILE = ".asset-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_digest(*parts):
+    """SHA-256 hex digest of some strings"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def local_imports(path):
+    """Helper modules next to path that it imports (import x / from x import y)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split('.')[0])
+
+    return sorted(
+        os.path.join(directory, f"{name}.py")
+        for name in names
+        if os.path.exists(os.path.join(directory, f"{name}.py"))
+    )
+
+
+def source_files(script):
+    """The script plus every local helper module it pulls in, transitively"""
+    seen = []
+    pending = [os.path.abspath(script)]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.append(path)
+        pending.extend(local_imports(path))
+    return sorted(seen)
+
+
+def split_tier_config(source):
+    """Split a script into (source without its tiers table, tiers dict)
+
+    Scripts keep their per-tier colours in a top-level `tiers = {...}` literal.
+    Hashing that table separately means editing one tier only invalidates that
+    tier's outputs. Scripts without such a table get an empty dict.
+    """
+    tree = ast.parse(source)
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == 'tiers'
+        ):
+            try:
+                tiers = ast.literal_eval(node.value)
+            except ValueError:
+                break
+            lines = source.splitlines(keepends=True)
+            rest = ''.join(lines[:node.lineno - 1] + lines[node.end_lineno:])
+            return rest, tiers
+    return source, {}
+
+
+class ScriptInputs:
+    """Hashed inputs shared by every output of one generator script or renderer module"""
+
+    def __init__(self, script, font_paths=(), pillow_version=''):
+        with open(script, encoding='utf-8') as f:
+            script_source, self.tiers = split_tier_config(f.read())
+
+        helper_sources = []
+        for path in source_files(script):
+            if path != os.path.abspath(script):
+                with open(path, encoding='utf-8') as f:
+                    helper_sources.append(os.path.basename(path) + '\n' + f.read())
+
+        self.source_hash = text_digest(script_source, *helper_sources)
+        # One entry per font family: a missing font means Pillow's default one
+        self.font_hash = text_digest(*(
+            f"{path}:{file_digest(path)}" if path else 'default-font' for path in font_paths
+        ))
+        self.pillow_version = pillow_version
+
+    def inputs_hash(self, tier=None):
+        """Hash of everything that determines one output (of tier, if the script has tiers)"""
+        tier_config = json.dumps(self.tiers.get(tier), sort_keys=True)
+        return text_digest(self.source_hash, tier_config, self.font_hash, self.pillow_version)
+
+
+class AssetManifest:
+    """Output path -> {inputs hash, output bytes hash}, persisted as JSON"""
+
+    def __init__(self, path=MANIFEST_FILE):
+        self.path = path
+        self.entries = {}
+        self.changed = False
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    self.entries = data.get('outputs', {})
+            except (OSError, ValueError):
+                # Unreadable manifest - everything is simply rebuilt once
+                self.entries = {}
+
+    def is_current(self, output, inputs_hash):
+        """True if output exists, was built from inputs_hash and is unmodified"""
+        entry = self.entries.get(output)
+        return (
+            entry is not None
+            and entry['inputs'] == inputs_hash
+            and os.path.exists(output)
+            and file_digest(output) == entry['sha256']
+        )
+
+    def record(self, output, inputs_hash):
+        """Remember that output (already on disk) was built from inputs_hash"""
+        entry = {'inputs': inputs_hash, 'sha256': file_digest(output)}
+        if self.entries.get(output) != entry:
+            self.entries[output] = entry
+            self.changed = True
+
+    def save(self):
+        """Write the manifest if anything changed (atomically)"""
+        if not self.changed:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'outputs': self.entries}, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(temp_path, self.path)
+        self.changed = False
+
+
+def publish(staged_path, output):
+    """Move a freshly built file into place unless the bytes are unchanged
+
+    Returns True if output was written, False if the existing file was kept.
+    """
+    if (
+        os.path.exists(output)
+        and os.path.getsize(output) == os.path.getsize(staged_path)
+        and file_digest(output) == file_digest(staged_path)
+    ):
+        os.remove(staged_path)
+        return False
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    os.replace(staged_path, output)
+    return True
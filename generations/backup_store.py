@@ -0,0 +1,184 @@
+"""
+x402 Protocol Pioneer Backup Store
+Content-addressed backups of the generated assets. Every distinct file is
+stored once under objects/ keyed by its SHA-256, and each backup run only
+writes a small snapshot index (path -> hash). Files whose size and mtime are
+unchanged since the last snapshot are not even re-read.
+
+Layout:
+    .asset-backups/objects/ab/cdef...   file contents
+    .asset-backups/snapshots/<id>.json  {"created": ..., "files": {path: hash}}
+    .asset-backups/stat-cache.json      {path: [size, mtime_ns, hash]}
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+
+BACKUP_DIR = ".asset-backups"
+
+
+def _file_digest(path):
+    """SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json(path, data):
+    """Write JSON atomically"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(temp_path, path)
+
+
+def _snapshot_order(snapshot_id):
+    """Sort key for snapshot ids (<date>_<time>[_<n>]): same-second ones by n, numerically"""
+    date, _, rest = snapshot_id.partition('_')
+    time, _, suffix = rest.partition('_')
+    return date, time, int(suffix) if suffix.isdigit() else 1
+
+
+def _read_json(path, default):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+class BackupStore:
+    """Deduplicating snapshot store rooted at root"""
+
+    def __init__(self, root=BACKUP_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.snapshots_dir = os.path.join(root, 'snapshots')
+        self.stat_cache_path = os.path.join(root, 'stat-cache.json')
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _store_file(self, path, digest):
+        """Copy path into the object store unless that content is already there"""
+        object_path = self.object_path(digest)
+        if os.path.exists(object_path):
+            return False
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        temp_path = object_path + '.tmp'
+        shutil.copyfile(path, temp_path)
+        os.replace(temp_path, object_path)
+        return True
+
+    def snapshot(self, sources):
+        """Back up every file under the source directories
+
+        Returns (snapshot id, files in the snapshot, new objects stored).
+        """
+        stat_cache = _read_json(self.stat_cache_path, {})
+        files = {}
+        stored = 0
+
+        for source_dir in sources:
+            for dirpath, _, filenames in os.walk(source_dir):
+                for filename in sorted(filenames):
+                    path = os.path.join(dirpath, filename)
+                    stat = os.stat(path)
+                    cached = stat_cache.get(path)
+                    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                        digest = cached[2]
+                    else:
+                        digest = _file_digest(path)
+                        stat_cache[path] = [stat.st_size, stat.st_mtime_ns, digest]
+                    # Re-store if a prune removed the object since it was cached
+                    if self._store_file(path, digest):
+                        stored += 1
+                    files[path] = digest
+
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        snapshot_id = base_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = 1
+        while os.path.exists(os.path.join(self.snapshots_dir, f"{snapshot_id}.json")):
+            suffix += 1
+            snapshot_id = f"{base_id}_{suffix:03d}"
+        _write_json(os.path.join(self.snapshots_dir, f"{snapshot_id}.json"), {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'files': files
+        })
+        _write_json(self.stat_cache_path, {path: entry for path, entry in stat_cache.items() if os.path.exists(path)})
+        return snapshot_id, len(files), stored
+
+    def snapshots(self):
+        """Snapshot ids, oldest first"""
+        if not os.path.isdir(self.snapshots_dir):
+            return []
+        ids = [name[:-5] for name in os.listdir(self.snapshots_dir) if name.endswith('.json')]
+        return sorted(ids, key=_snapshot_order)
+
+    def load_snapshot(self, snapshot_id):
+        """Snapshot index ({'created': ..., 'files': {path: hash}})"""
+        path = os.path.join(self.snapshots_dir, f"{snapshot_id}.json")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No backup snapshot '{snapshot_id}'")
+        return _read_json(path, {'files': {}})
+
+    def restore(self, snapshot_id):
+        """Put every file of a snapshot back in place
+
+        Files that already hold the right bytes are left untouched. Returns
+        the number of files written.
+        """
+        files = self.load_snapshot(snapshot_id)['files']
+        written = 0
+        for path, digest in sorted(files.items()):
+            if os.path.exists(path) and _file_digest(path) == digest:
+                continue
+            object_path = self.object_path(digest)
+            if not os.path.exists(object_path):
+                raise FileNotFoundError(f"Backup object for {path} is missing ({digest[:12]})")
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            temp_path = path + '.restore-tmp'
+            shutil.copyfile(object_path, temp_path)
+            os.replace(temp_path, path)
+            written += 1
+        return written
+
+    def prune(self, keep):
+        """Delete all but the newest keep snapshots and any objects no longer referenced
+
+        Returns (snapshots removed, objects removed).
+        """
+        snapshot_ids = self.snapshots()
+        doomed = snapshot_ids[:max(0, len(snapshot_ids) - keep)]
+        for snapshot_id in doomed:
+            os.remove(os.path.join(self.snapshots_dir, f"{snapshot_id}.json"))
+
+        referenced = set()
+        for snapshot_id in self.snapshots():
+            referenced.update(self.load_snapshot(snapshot_id)['files'].values())
+
+        removed_objects = 0
+        if os.path.isdir(self.objects_dir):
+            for prefix in os.listdir(self.objects_dir):
+                prefix_dir = os.path.join(self.objects_dir, prefix)
+                for name in os.listdir(prefix_dir):
+                    if prefix + name not in referenced:
+                        os.remove(os.path.join(prefix_dir, name))
+                        removed_objects += 1
+                if not os.listdir(prefix_dir):
+                    os.rmdir(prefix_dir)
+
+        return len(doomed), removed_objects
+
+    def disk_usage(self):
+        """Total bytes held in the object store"""
+        total = 0
+        for dirpath, _, filenames in os.walk(self.objects_dir):
+            total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+        return total
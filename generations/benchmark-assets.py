@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+x402 Protocol Pioneer Asset Benchmarks
+Times every stage of the asset pipeline - the frames of each timeline phase,
+generate_gif per tier, create_static_nft, create_logo_square at every size
+and both banner builders - and records output size and peak RSS. Results
+are appended to a JSON history; a case that is slower, larger or hungrier
+than its recent baseline (beyond the thresholds) fails the run. After an
+intended slowdown or size change, --accept records the run as the new
+baseline.
+"""
+
+import argparse
+import sys
+
+import asset_benchmarks
+from dependencies import require_dependencies
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the x402 asset pipeline against its history")
+    parser.add_argument(
+        'patterns', nargs='*',
+        help="only run cases matching these globs, e.g. 'draw_phase/*' (default: all)"
+    )
+    parser.add_argument(
+        '--list', action='store_true',
+        help="list the benchmark cases and exit"
+    )
+    parser.add_argument(
+        '--rounds', type=int,
+        help="timed rounds per case (default: per case)"
+    )
+    parser.add_argument(
+        '--history', default=asset_benchmarks.HISTORY_FILE,
+        help=f"history file (default: {asset_benchmarks.HISTORY_FILE})"
+    )
+    parser.add_argument(
+        '--no-record', action='store_true',
+        help="compare against the history without adding this run to it"
+    )
+    parser.add_argument(
+        '--accept', '--update-baseline', action='store_true',
+        help="record this run as the new baseline, e.g. after an intended slowdown or size change "
+             "(regressions are reported but do not fail the run)"
+    )
+    parser.add_argument(
+        '--no-isolate', action='store_true',
+        help="run every case in this process (faster, but peak RSS is cumulative)"
+    )
+    parser.add_argument(
+        '--time-threshold', type=float, default=asset_benchmarks.TIME_THRESHOLD,
+        help=f"allowed slowdown as a fraction (default: {asset_benchmarks.TIME_THRESHOLD})"
+    )
+    parser.add_argument(
+        '--size-threshold', type=float, default=asset_benchmarks.SIZE_THRESHOLD,
+        help=f"allowed output size growth as a fraction (default: {asset_benchmarks.SIZE_THRESHOLD})"
+    )
+    parser.add_argument(
+        '--rss-threshold', type=float, default=asset_benchmarks.RSS_THRESHOLD,
+        help=f"allowed peak RSS growth as a fraction (default: {asset_benchmarks.RSS_THRESHOLD})"
+    )
+    return parser.parse_args()
+
+def format_result(result):
+    size = f"{result['bytes'] / 1024:8.1f}KB" if result['bytes'] is not None else f"{'-':>10}"
+    return f"{result['seconds'] * 1000:9.2f}ms  {size}  {result['peak_rss_kb'] / 1024:6.0f}MB RSS"
+
+def main():
+    """Run the benchmarks and compare them with the history"""
+    args = parse_args()
+    
+    cases = asset_benchmarks.select_cases(args.patterns)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return True
+    if not cases:
+        print(f"❌ No benchmark cases match: {' '.join(args.patterns)}")
+        return False
+    
+    if args.accept and args.no_record:
+        print("❌ --accept records the run, so it cannot be combined with --no-record")
+        return False
+    
+    require_dependencies()
+    
+    history = asset_benchmarks.BenchmarkHistory(args.history)
+    env = asset_benchmarks.environment()
+    print(f"⏱️  x402 asset benchmarks ({len(cases)} cases, Python {env['python']}, Pillow {env['pillow']})\n")
+    
+    failed = []
+    
+    def report(case, result):
+        baseline = history.baseline(case.name, env)
+        problems = asset_benchmarks.regressions(
+            result, baseline, args.time_threshold, args.size_threshold, args.rss_threshold
+        )
+        if problems:
+            failed.append(case.name)
+            print(f"❌ {case.name:32} {format_result(result)}  REGRESSION: {', '.join(problems)}")
+        elif baseline is None:
+            print(f"🆕 {case.name:32} {format_result(result)}  (no baseline yet)")
+        else:
+            change = (result['seconds'] / baseline['seconds'] - 1) * 100 if baseline['seconds'] else 0
+            print(f"✅ {case.name:32} {format_result(result)}  ({change:+.0f}% vs baseline)")
+    
+    results = asset_benchmarks.run_cases(cases, args.rounds, not args.no_isolate, report)
+    
+    if not args.no_record:
+        history.record(results, env, passed=not failed, accepted=args.accept)
+        history.save()
+        print(f"\n📝 Recorded in {args.history}")
+    
+    if args.accept:
+        print(f"\n✅ Accepted as the new baseline for {len(results)} case(s)")
+        return True
+    
+    if failed:
+        print(f"\n❌ {len(failed)} case(s) regressed: {', '.join(failed)}")
+        return False
+    
+    print("\n🎉 No regressions")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,547 @@
+"""
+x402 Protocol Pioneer Brand Assets
+Logos, favicons, OpenGraph images and the marketplace banner, matching the
+NFT PNG generator style exactly:
+- Blue background (#0000ff)
+- Black X
+- White 402
+- Monaco/Courier monospace font
+- Proper spacing between X and 402
+
+Importing this module has no side effects.
+"""
+
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter
+
+import font_registry
+from gradients import linear_gradient
+from render_graph import RenderGraph
+from text_effects import draw_text
+
+# Brand colors (matching NFT collection)
+BLUE = (0, 0, 255)  # #0000ff - background
+BLACK = (0, 0, 0)  # #000000 - X
+WHITE = (255, 255, 255)  # #ffffff - 402
+GRAY_100 = (10, 11, 13)  # #0a0b0d
+
+# Square logos are rendered once at this size (4x the largest output) and
+# area-averaged down to every other size
+LOGO_MASTER_SIZE = 2048
+
+# (largest size, unsharp mask percent) - downscaling softens the smallest
+# logos most, so they get the most sharpening; larger sizes get none
+LOGO_SHARPEN = [
+    (64, 70),
+    (128, 50),
+    (180, 30)
+]
+
+def get_fonts(x_size, num_size):
+    """Get Monaco/Courier monospace fonts matching the NFT PNG style (cached by the font registry)"""
+    return font_registry.get_fonts({'x': x_size, 'num': num_size})
+
+
+def create_rounded_rectangle(size: int) -> Image.Image:
+    """
+    Create a rounded rectangle mask matching Base logo style
+    Base uses rounded corners with radius proportional to size
+    """
+    # Create mask for rounded corners
+    mask = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(mask)
+    
+    # Corner radius - Base uses ~7.9% of size (19.671/249 from their logo)
+    radius = int(size * 0.079)
+    
+    # Draw rounded rectangle on mask
+    draw.rounded_rectangle([(0, 0), (size, size)], radius=radius, fill=255)
+    
+    return mask
+
+
+def create_favicon_version(size: int, padding_ratio: float = 0.12) -> Image.Image:
+    """
+    Create simplified favicon version (just white 402, no X)
+    Optimized for tiny sizes (16x16, 32x32, 48x48)
+    """
+    # Create image with blue background and rounded corners
+    img = Image.new('RGBA', (size, size), BLUE + (255,))
+    
+    # Apply rounded corners for sizes 32+
+    if size >= 32:
+        mask = create_rounded_rectangle(size)
+        img.putalpha(mask)
+    
+    draw = ImageDraw.Draw(img)
+    
+    # Calculate font sizes for favicons - moderate size for just "402"
+    # This is SEPARATE from x402logos - favicons are simpler
+    num_size = int(size * 0.50)  # 50% of image size for standalone 402
+    
+    fonts = get_fonts(x_size=100, num_size=num_size)
+    font = fonts['num']
+    
+    # Draw 402 centered
+    text = "402"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    
+    text_x = (size - text_width) // 2
+    text_y = (size - text_height) // 2
+    
+    # Draw the text in white
+    draw.text((text_x, text_y), text, font=font, fill=WHITE)
+    
+    return img
+
+
+def create_logo_square(size: int, padding_ratio: float = 0.15, transparent_bg: bool = False) -> Image.Image:
+    """
+    Create the x402logo square with Base-style rounded corners
+    - Blue background with rounded corners (or transparent)
+    - Black "X" on top
+    - White "402" below with proper spacing
+    - Monaco/Courier monospace font
+    - BIG and readable - fills 85-90% of square
+    """
+    # Create image
+    if transparent_bg:
+        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    else:
+        img = Image.new('RGBA', (size, size), BLUE + (255,))
+        # Apply rounded corners
+        mask = create_rounded_rectangle(size)
+        img.putalpha(mask)
+    
+    draw = ImageDraw.Draw(img)
+    
+    # Calculate font sizes to fill the logo square
+    # SEPARATE from favicon logic - these need to be much bigger
+    # X should be ~75% of image height
+    # 402 should be ~37.5% of image height (half of X)
+    x_font_size = int(size * 0.75)
+    num_font_size = int(size * 0.375)
+    
+    fonts = get_fonts(x_size=x_font_size, num_size=num_font_size)
+    
+    # Calculate center
+    center_x = size // 2
+    center_y = size // 2
+    
+    # X color based on background
+    x_color = BLUE if transparent_bg else BLACK
+    
+    # Draw X (positioned above center to make room for 402 at center)
+    try:
+        x_text = "X"
+        x_font = fonts['x']
+        
+        # Get text dimensions
+        bbox = draw.textbbox((0, 0), x_text, font=x_font)
+        x_width = bbox[2] - bbox[0]
+        x_height = bbox[3] - bbox[1]
+        
+        # Get 402 dimensions to calculate positioning
+        num_text = "402"
+        num_font = fonts['num']
+        bbox_num = draw.textbbox((0, 0), num_text, font=num_font)
+        num_width = bbox_num[2] - bbox_num[0]
+        
+        # Spacing between X and 402
+        spacing = int(size * 0.03)
+        
+        # Position 402 so its TOP is at center_y
+        num_x = center_x - (num_width // 2)
+        num_y = center_y
+        
+        # Position X above 402 (work backwards from 402 position)
+        x_x = center_x - (x_width // 2)
+        x_y = num_y - spacing - x_height
+        
+        # Draw X, with a white stroke for visibility on dark backgrounds when transparent
+        if transparent_bg:
+            stroke_width = max(int(size * 0.004), 1)
+            draw_text(img, (x_x, x_y), x_text, x_font, x_color, outline=WHITE, outline_width=stroke_width)
+        else:
+            draw.text((x_x, x_y), x_text, font=x_font, fill=x_color)
+        
+    except Exception as e:
+        print(f"Warning: Could not render X properly: {e}")
+        x_y = center_y - int(size * 0.156)
+        x_height = int(size * 0.31)
+    
+    # Draw 402 (already positioned above, just draw it)
+    try:
+        
+        # Draw 402 in white
+        draw.text((num_x, num_y), num_text, font=num_font, fill=WHITE)
+        
+    except Exception as e:
+        print(f"Warning: Could not render 402 properly: {e}")
+    
+    return img
+
+
+def sharpen_logo(img: Image.Image) -> Image.Image:
+    """Per-size unsharp mask for a downscaled logo (colour only, the alpha edge is kept)"""
+    for max_size, percent in LOGO_SHARPEN:
+        if img.width <= max_size:
+            break
+    else:
+        return img
+    
+    rgb = img.convert('RGB').filter(ImageFilter.UnsharpMask(radius=1, percent=percent, threshold=2))
+    rgb.putalpha(img.getchannel('A'))
+    return rgb
+
+
+def logo_pyramid(sizes, transparent_bg: bool = False, sharpen: bool = True, master_size: int = None) -> dict:
+    """
+    Square logos at every size in sizes from a single supersampled render
+    The master is halved repeatedly (2x2 area averages) and each size is
+    box-filtered from the nearest level at least as large. Resampling runs on
+    premultiplied alpha so the rounded corners do not pick up dark fringes.
+    Returns {size: image}.
+    """
+    master = create_logo_square(master_size or LOGO_MASTER_SIZE, transparent_bg=transparent_bg)
+    levels = [master.convert('RGBa')]
+    
+    logos = {}
+    for size in sorted(set(sizes), reverse=True):
+        while levels[-1].width // 2 >= size:
+            levels.append(levels[-1].reduce(2))
+        level = levels[-1]
+        if level.width != size:
+            level = level.resize((size, size), Image.Resampling.BOX)
+        
+        logo = level.convert('RGBA')
+        logos[size] = sharpen_logo(logo) if sharpen else logo
+    
+    return logos
+
+
+def og_logo_size(height: int = 630) -> int:
+    return int(height * 0.5)
+
+
+def create_og_background(width: int = 1200, height: int = 630, logo: Image.Image = None) -> Image.Image:
+    """
+    Create the OpenGraph plate shared by every variant: blue background and logo
+    logo is a pre-rendered og_logo_size(height) square (drawn here if None)
+    """
+    # Create image with blue background
+    img = Image.new('RGBA', (width, height), BLUE + (255,))
+    
+    # Add logo in center-left
+    logo_size = og_logo_size(height)
+    if logo is None:
+        logo = create_logo_square(logo_size, padding_ratio=0.15)
+    logo_x = int(width * 0.12)
+    logo_y = (height - logo_size) // 2
+    img.paste(logo, (logo_x, logo_y), logo)
+    
+    return img
+
+
+def create_og_image(width: int = 1200, height: int = 630, 
+                   title: str = "x402 Pioneers", 
+                   subtitle: str = "x402 Micropayments on Base",
+                   background: Image.Image = None) -> Image.Image:
+    """
+    Create OpenGraph social sharing image
+    background is a shared create_og_background plate (copied, not modified)
+    """
+    if background is None:
+        background = create_og_background(width, height)
+    img = background.copy()
+    draw = ImageDraw.Draw(img)
+    
+    logo_size = og_logo_size(height)
+    logo_x = int(width * 0.12)
+    
+    # Add text on the right
+    try:
+        # Try to get nice fonts for text
+        title_size = int(height * 0.12)
+        subtitle_size = int(height * 0.055)
+        
+        helvetica_path = font_registry.find_font_path(font_registry.HELVETICA_FONT_PATHS)
+        if helvetica_path:
+            title_font = font_registry.load_font(helvetica_path, title_size)
+            subtitle_font = font_registry.load_font(helvetica_path, subtitle_size)
+        else:
+            fonts = get_fonts(x_size=100, num_size=title_size)
+            title_font = fonts['num']
+            subtitle_font = fonts['num']
+        
+        text_x = logo_x + logo_size + int(width * 0.08)
+        
+        # Draw title
+        title_bbox = draw.textbbox((0, 0), title, font=title_font)
+        title_height = title_bbox[3] - title_bbox[1]
+        title_y = (height // 2) - int(title_height * 0.7)
+        
+        # Title with a stroke
+        draw_text(img, (text_x, title_y), title, title_font, WHITE, outline=BLUE, outline_width=2)
+        
+        # Draw subtitle
+        subtitle_y = title_y + title_height + int(height * 0.06)
+        
+        # Subtitle with a thinner stroke
+        draw_text(img, (text_x, subtitle_y), subtitle, subtitle_font, WHITE, outline=BLUE, outline_width=1)
+        
+    except Exception as e:
+        print(f"Warning: Could not render OG text properly: {e}")
+    
+    return img
+
+
+def banner_logo_size(height: int = 400) -> int:
+    return int(height * 0.55)
+
+
+def create_collection_banner(width: int = 1200, height: int = 400, logo: Image.Image = None) -> Image.Image:
+    """
+    Create collection banner for NFT marketplace
+    logo is a pre-rendered banner_logo_size(height) square (drawn here if None)
+    """
+    # Create gradient background (blue to darker blue): a subtle darkening
+    # overlay composited over the blue
+    img = Image.new('RGBA', (width, height), BLUE + (255,))
+    img = Image.alpha_composite(img, linear_gradient((width, height), [(0, (0, 0, 0, 0)), (1, (0, 0, 0, 30))]))
+    draw = ImageDraw.Draw(img)
+    
+    # Add large logo on left
+    logo_size = banner_logo_size(height)
+    if logo is None:
+        logo = create_logo_square(logo_size, padding_ratio=0.12)
+    logo_x = int(width * 0.08)
+    logo_y = (height - logo_size) // 2
+    img.paste(logo, (logo_x, logo_y), logo)
+    
+    # Add text
+    try:
+        title_size = int(height * 0.18)
+        subtitle_size = int(height * 0.08)
+        
+        # Try to get nice fonts for banner text
+        helvetica_path = font_registry.find_font_path(font_registry.HELVETICA_FONT_PATHS)
+        if helvetica_path:
+            title_font = font_registry.load_font(helvetica_path, title_size)
+            subtitle_font = font_registry.load_font(helvetica_path, subtitle_size)
+        else:
+            fonts = get_fonts(x_size=100, num_size=title_size)
+            title_font = fonts['num']
+            subtitle_font = fonts['num']
+        
+        text_x = logo_x + logo_size + int(width * 0.06)
+        
+        # Title
+        title = "x402Collection"
+        title_bbox = draw.textbbox((0, 0), title, font=title_font)
+        title_height = title_bbox[3] - title_bbox[1]
+        title_y = (height // 2) - int(title_height * 0.8)
+        
+        # Shadow
+        draw_text(img, (text_x, title_y), title, title_font, WHITE, shadow=GRAY_100, shadow_spread=2)
+        
+        # Subtitle
+        subtitle = "Limited to 402 • x402 Protocol • Base"
+        subtitle_y = title_y + title_height + int(height * 0.08)
+        
+        draw_text(img, (text_x, subtitle_y), subtitle, subtitle_font, WHITE, shadow=GRAY_100, shadow_spread=1)
+        
+    except Exception as e:
+        print(f"Warning: Could not render banner text: {e}")
+    
+    return img
+
+
+# Output files: (size, filename)
+LOGO_SIZES = [
+    (512, "logo.png"),
+    (256, "logo-256.png"),
+    (128, "logo-128.png"),
+    (64, "logo-64.png"),
+    (32, "logo-32.png"),
+]
+TRANSPARENT_LOGO_SIZES = [
+    (512, "logo-transparent.png"),
+    (256, "logo-transparent-256.png"),
+]
+
+# Small favicons use the simplified design (just 402, no X); larger ones the full logo
+SMALL_FAVICON_SIZES = [16, 32, 48]
+LARGE_FAVICON_SIZES = [64, 128, 256]
+APPLE_ICON_SIZE = 180
+ICO_LOGO_SIZE = 64
+
+# (filename, title, subtitle)
+OG_VARIANTS = [
+    ("og-default.png", "x402 Pioneers", "x402 Micropayments on Base"),
+    ("og-home.png", "x402 Pioneers", "Limited Edition NFTs • Base Blockchain"),
+    ("og-mint.png", "Mint x402 NFTs", "Only 402 Available • $1 USDC Each"),
+]
+
+
+def build_brand_graph(pyramid=True, sharpen=True) -> RenderGraph:
+    """
+    Render graph for every brand asset
+    Nodes: logo-{size}, transparent-logo-{size}, favicon-{size} (simplified),
+    og-background, og:{filename}, collection-banner and favicon.ico (the list
+    of ICO images). Each logo, favicon and plate is rendered once and shared
+    by every asset built from it.
+    """
+    graph = RenderGraph()
+    
+    # Full-logo squares (padding_ratio does not change the square logo layout)
+    square_sizes = sorted(
+        {size for size, _ in LOGO_SIZES}
+        | set(LARGE_FAVICON_SIZES)
+        | {APPLE_ICON_SIZE, ICO_LOGO_SIZE, og_logo_size(), banner_logo_size()}
+    )
+    transparent_sizes = sorted({size for size, _ in TRANSPARENT_LOGO_SIZES})
+    
+    if pyramid:
+        graph.add('logos', lambda: logo_pyramid(square_sizes, sharpen=sharpen))
+        graph.add('transparent-logos', lambda: logo_pyramid(transparent_sizes, transparent_bg=True, sharpen=sharpen))
+        for size in square_sizes:
+            graph.add(f'logo-{size}', lambda logos, size=size: logos[size], 'logos')
+        for size in transparent_sizes:
+            graph.add(f'transparent-logo-{size}', lambda logos, size=size: logos[size], 'transparent-logos')
+    else:
+        for size in square_sizes:
+            graph.add(f'logo-{size}', lambda size=size: create_logo_square(size))
+        for size in transparent_sizes:
+            graph.add(f'transparent-logo-{size}', lambda size=size: create_logo_square(size, transparent_bg=True))
+    
+    for size in SMALL_FAVICON_SIZES:
+        graph.add(f'favicon-{size}', lambda size=size: create_favicon_version(size))
+    
+    graph.add('og-background', lambda logo: create_og_background(logo=logo), f'logo-{og_logo_size()}')
+    for filename, title, subtitle in OG_VARIANTS:
+        graph.add(
+            f'og:{filename}',
+            lambda background, title=title, subtitle=subtitle: create_og_image(title=title, subtitle=subtitle, background=background),
+            'og-background'
+        )
+    
+    graph.add('collection-banner', lambda logo: create_collection_banner(logo=logo), f'logo-{banner_logo_size()}')
+    
+    # Simplified images for the tiny sizes, full logo for the largest
+    graph.add(
+        'favicon.ico', lambda *images: list(images),
+        *[f'favicon-{size}' for size in SMALL_FAVICON_SIZES], f'logo-{ICO_LOGO_SIZE}'
+    )
+    
+    return graph
+
+
+def generate_all_assets(public_dir="public", pyramid=True, sharpen=True):
+    """Generate all required logo sizes and brand assets
+    
+    Everything is rendered through build_brand_graph, so shared logos and
+    plates are drawn once. With pyramid=True every full-logo square comes
+    from one supersampled render per variant (see logo_pyramid);
+    pyramid=False draws each size directly. The simplified small favicons
+    are always drawn directly.
+    """
+    
+    # Create output directories
+    public_dir = Path(public_dir)
+    images_dir = public_dir / "images"
+    icons_dir = public_dir / "icons"
+    
+    images_dir.mkdir(parents=True, exist_ok=True)
+    icons_dir.mkdir(parents=True, exist_ok=True)
+    
+    print("🎨 Generating x402Brand Assets...")
+    print("   Style: Matching NFT PNG Generator")
+    print("   Colors: Blue BG + Black X + White 402")
+    print("   Font: Monaco/Courier Monospace")
+    print("   Spacing: X and 402 properly separated")
+    print()
+    
+    graph = build_brand_graph(pyramid, sharpen)
+    if pyramid:
+        print("🔺 Logo pyramid: one supersampled master per variant, area-averaged down\n")
+    
+    # 1. Generate main logo (multiple sizes)
+    print("📦 Generating logos...")
+    for size, filename in LOGO_SIZES:
+        output_path = images_dir / filename
+        graph.get(f'logo-{size}').save(output_path, "PNG")
+        print(f"   ✓ {filename} ({size}x{size})")
+    
+    # 2. Generate logo with transparent background
+    print("\n🎭 Generating transparent logos...")
+    for size, filename in TRANSPARENT_LOGO_SIZES:
+        output_path = images_dir / filename
+        graph.get(f'transparent-logo-{size}').save(output_path, "PNG")
+        print(f"   ✓ {filename} ({size}x{size}) - blue X with white stroke")
+    
+    # 3. Generate favicon sizes (simplified version for tiny sizes)
+    print("\n🌐 Generating favicons...")
+    
+    # Small favicons - use simplified version (just 402, no X)
+    for size in SMALL_FAVICON_SIZES:
+        output_path = icons_dir / f"favicon-{size}x{size}.png"
+        graph.get(f'favicon-{size}').save(output_path, "PNG")
+        print(f"   ✓ favicon-{size}x{size}.png (simplified)")
+    
+    # Larger favicons - use full logo
+    for size in LARGE_FAVICON_SIZES:
+        output_path = icons_dir / f"favicon-{size}x{size}.png"
+        graph.get(f'logo-{size}').save(output_path, "PNG")
+        print(f"   ✓ favicon-{size}x{size}.png (full logo)")
+    
+    # 4. Apple Touch Icon (full logo version)
+    print("\n🍎 Generating Apple Touch Icon...")
+    graph.get(f'logo-{APPLE_ICON_SIZE}').save(public_dir / "apple-touch-icon.png", "PNG")
+    print(f"   ✓ apple-touch-icon.png ({APPLE_ICON_SIZE}x{APPLE_ICON_SIZE})")
+    
+    # 5. OpenGraph images
+    print("\n📱 Generating OpenGraph images...")
+    for filename, _, _ in OG_VARIANTS:
+        og_img = graph.get(f'og:{filename}')
+        output_path = images_dir / filename
+        og_img.save(output_path, "PNG")
+        print(f"   ✓ {filename} (1200x630)")
+    
+    # 6. Collection Banner
+    print("\n🎭 Generating collection banner...")
+    banner = graph.get('collection-banner')
+    banner.save(images_dir / "collection-banner.png", "PNG")
+    print("   ✓ collection-banner.png (1200x400)")
+    
+    # 7. Generate favicon.ico (multi-size ICO file with simplified small sizes)
+    print("\n⭐ Generating favicon.ico...")
+    try:
+        # Use simplified version for tiny sizes, full logo for larger
+        ico_images = graph.get('favicon.ico')
+        ico_sizes = SMALL_FAVICON_SIZES + [ICO_LOGO_SIZE]
+        ico_path = public_dir / "favicon.ico"
+        # Pillow drops ICO sizes larger than the image being saved, so save the largest
+        ico_images[-1].save(
+            ico_path,
+            format='ICO',
+            sizes=[(s, s) for s in ico_sizes],
+            append_images=ico_images[:-1]
+        )
+        print("   ✓ favicon.ico (multi-size with optimized small icons)")
+    except Exception as e:
+        print(f"   ⚠ Could not generate favicon.ico: {e}")
+        print("   ℹ You can convert favicon-32x32.png manually if needed")
+    
+    print(f"\n🧩 {len(graph.results)} render nodes, each rendered once")
+    print("\n✨ All assets generated successfully!")
+    print("\n📁 Output locations:")
+    print(f"   • Logos: {images_dir}/")
+    print(f"   • Icons: {icons_dir}/")
+    print(f"   • Favicon: {public_dir}/favicon.ico")
+    print(f"   • Apple Icon: {public_dir}/apple-touch-icon.png")
+    print("\n🎉 Your x402 Pioneer brand is ready!")
+    print("✅ Matched NFT PNG generator proportions and spacing")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+x402 Protocol Pioneer Startup Time Check
+Times the generator entry points that should start instantly - `--help` for
+each script and a no-op incremental `regenerate-assets.py --check` - and
+exits non-zero if any of them is missing or goes over its budget. The
+scripts are found and run in this file's directory, wherever it is started
+from; run it after a regenerate (so the check really is a no-op) in CI.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (command arguments, budget in ms) - best of several runs, including interpreter start-up
+STARTUP_BUDGETS = [
+    (["generate-gifs-improved.py", "--help"], 150),
+    (["generate-png-improved.py", "--help"], 150),
+    (["generate-collection-banner.py", "--help"], 150),
+    (["generate-logos.py", "--help"], 150),
+    (["regenerate-assets.py", "--help"], 150),
+    (["regenerate-assets.py", "--check"], 1000)
+]
+
+
+def time_command(args, runs):
+    """Best wall-clock time in ms over runs, and the last exit status"""
+    best = None
+    returncode = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable] + args, capture_output=True, cwd=SCRIPT_DIR)
+        elapsed = (time.perf_counter() - start) * 1000
+        returncode = result.returncode
+        best = elapsed if best is None else min(best, elapsed)
+    return best, returncode
+
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Check generator start-up times against their budgets")
+    parser.add_argument(
+        '--runs', type=int, default=5,
+        help="runs per command; the fastest counts (default: 5)"
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1.0,
+        help="multiply every budget, e.g. 2 on a slow CI machine (default: 1)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """Time each entry point and compare with its budget"""
+    args = parse_args()
+
+    print("⏱️  x402 generator start-up times")
+    baseline, _ = time_command(["-c", "pass"], args.runs)
+    print(f"   (bare interpreter: {baseline:.0f}ms)\n")
+
+    over_budget = []
+    missing = []
+    for command, budget in STARTUP_BUDGETS:
+        name = " ".join(command)
+        if not os.path.exists(os.path.join(SCRIPT_DIR, command[0])):
+            missing.append(name)
+            print(f"❌ {name}: script not found")
+            continue
+
+        budget *= args.scale
+        elapsed, returncode = time_command(command, args.runs)
+        if returncode != 0 and command[-1] == "--check":
+            print(f"⚠️  {name}: assets are stale, so this was not a no-op run - regenerate first")
+
+        if elapsed > budget:
+            over_budget.append(name)
+            print(f"❌ {name}: {elapsed:.0f}ms (budget {budget:.0f}ms)")
+        else:
+            print(f"✅ {name}: {elapsed:.0f}ms (budget {budget:.0f}ms)")
+
+    if missing:
+        print(f"\n❌ {len(missing)} entry point(s) not found in {SCRIPT_DIR}")
+    if over_budget:
+        print(f"\n❌ {len(over_budget)} entry point(s) over budget")
+    if missing or over_budget:
+        return False
+
+    print("\n🎉 All entry points within their start-up budget")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,31 @@
+"""
+x402 Protocol Pioneer Dependency Check
+Cheap capability check for the generator scripts. Packages are looked up
+without importing them and pip is never run - a missing dependency is
+reported together with the command that installs it.
+"""
+
+import importlib.util
+import sys
+
+# Import name -> pip package name
+REQUIRED_PACKAGES = {
+    'PIL': 'pillow'
+}
+
+
+def missing_packages():
+    """pip names of required packages that cannot be imported"""
+    return [
+        package for module, package in REQUIRED_PACKAGES.items()
+        if importlib.util.find_spec(module) is None
+    ]
+
+
+def require_dependencies():
+    """Exit with install instructions if a required package is missing"""
+    missing = missing_packages()
+    if missing:
+        print(f"❌ Missing Python dependencies: {', '.join(missing)}")
+        print(f"   Install with: {sys.executable} -m pip install {' '.join(missing)}")
+        sys.exit(1)
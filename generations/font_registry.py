@@ -0,0 +1,71 @@
+"""
+x402 Protocol Pioneer Font Registry
+Shared, process-wide font cache used by every asset generator script.
+Font discovery runs once and FreeType faces are cached by (path, size).
+Pillow is imported on first font load, so path lookups stay cheap.
+"""
+
+import os
+from functools import lru_cache
+
+# Monospace fonts, in order of preference (Monaco/Courier on macOS, DejaVu on Linux)
+MONOSPACE_FONT_PATHS = (
+    "/System/Library/Fonts/Monaco.ttc",
+    "/System/Library/Fonts/Courier.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+    "/usr/share/fonts/TTF/DejaVuSansMono.ttf",
+)
+
+# Sans-serif display font used for OpenGraph and banner titles
+HELVETICA_FONT_PATHS = (
+    "/System/Library/Fonts/Helvetica.ttc",
+)
+
+# Every font family the renderers look up (asset hashes cover each one)
+FONT_FAMILIES = (MONOSPACE_FONT_PATHS, HELVETICA_FONT_PATHS)
+
+
+@lru_cache(maxsize=None)
+def find_font_path(candidates=MONOSPACE_FONT_PATHS):
+    """Return the first existing font file from candidates (or None), scanning only once"""
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def resolved_font_paths():
+    """The font file each of FONT_FAMILIES resolves to here (None where none is installed)"""
+    return tuple(find_font_path(candidates) for candidates in FONT_FAMILIES)
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a FreeType face, cached for the lifetime of the process"""
+    from PIL import ImageFont
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=None)
+def default_font():
+    """Pillow's built-in fallback font"""
+    from PIL import ImageFont
+    return ImageFont.load_default()
+
+
+def get_font(size, candidates=MONOSPACE_FONT_PATHS):
+    """Get the best available font at the given size, falling back to Pillow's default"""
+    font_path = find_font_path(candidates)
+    if font_path is None:
+        return default_font()
+
+    try:
+        return load_font(font_path, size)
+    except Exception as e:
+        print(f"Font loading warning: {e}")
+        return default_font()
+
+
+def get_fonts(sizes, candidates=MONOSPACE_FONT_PATHS):
+    """Get a dict of named fonts from a {name: size} mapping, e.g. {'code': 24, 'x': 200}"""
+    return {name: get_font(size, candidates) for name, size in sizes.items()}
@@ -0,0 +1,97 @@
+"""
+x402 Protocol Pioneer Frame Compositor
+Blends translucent draw operations into a frame using layers sized to their
+bounding box instead of full-canvas RGBA overlays. The frame is converted to
+RGBA once, every layer is blended over its dirty rectangle only, and the
+result is converted back to RGB once at the end.
+"""
+
+from PIL import Image, ImageDraw
+
+
+def union_boxes(boxes):
+    """Smallest (x0, y0, x1, y1) box containing every box in boxes"""
+    boxes = list(boxes)
+    return (
+        min(b[0] for b in boxes),
+        min(b[1] for b in boxes),
+        max(b[2] for b in boxes),
+        max(b[3] for b in boxes)
+    )
+
+
+def text_box(xy, text, font, pad=2):
+    """Box covering text drawn at xy (default 'la' anchor), with a little padding"""
+    left, top, right, bottom = font.getbbox(text)
+    x, y = xy
+    return (x + left - pad, y + top - pad, x + right + pad, y + bottom + pad)
+
+
+class CompositeLayer:
+    """Transparent RGBA layer covering one box of the frame
+
+    Drawing methods take frame coordinates and translate them into the layer.
+    """
+
+    def __init__(self, box):
+        self.box = box
+        self.image = Image.new('RGBA', (box[2] - box[0], box[3] - box[1]), (0, 0, 0, 0))
+        self.draw = ImageDraw.Draw(self.image)
+
+    def _translate(self, xy):
+        return (xy[0] - self.box[0], xy[1] - self.box[1])
+
+    def text(self, xy, text, **kwargs):
+        """Draw text at frame coordinates"""
+        self.draw.text(self._translate(xy), text, **kwargs)
+
+    def line(self, points, **kwargs):
+        """Draw a line through frame coordinates"""
+        self.draw.line([self._translate(p) for p in points], **kwargs)
+
+    def bitmap(self, xy, bitmap, **kwargs):
+        """Blend an 'L' mask in the fill colour at frame coordinates"""
+        self.draw.bitmap(self._translate(xy), bitmap, **kwargs)
+
+
+class FrameCompositor:
+    """Accumulate bounding-box layers over an RGB frame"""
+
+    def __init__(self, img):
+        self.size = img.size
+        self.canvas = img.convert('RGBA')
+
+    def new_layer_box(self, box):
+        """Clip box to the frame, or None if nothing of it is visible"""
+        width, height = self.size
+        box = (
+            max(0, int(box[0])),
+            max(0, int(box[1])),
+            min(width, int(box[2])),
+            min(height, int(box[3]))
+        )
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return None
+        return box
+
+    def new_layer(self, box):
+        """Create a layer for box clipped to the frame, or None if nothing is visible"""
+        box = self.new_layer_box(box)
+        return CompositeLayer(box) if box else None
+
+    def composite(self, layer):
+        """Blend a layer over its dirty rectangle"""
+        if layer is not None:
+            self.canvas.alpha_composite(layer.image, dest=layer.box[:2])
+
+    def composite_image(self, image, xy):
+        """Blend a ready-made RGBA image whose top-left sits at frame position xy"""
+        box = self.new_layer_box((xy[0], xy[1], xy[0] + image.width, xy[1] + image.height))
+        if box is None:
+            return
+        source = (box[0] - xy[0], box[1] - xy[1], box[2] - xy[0], box[3] - xy[1])
+        self.canvas.alpha_composite(image, dest=box[:2], source=source)
+
+    def to_rgb(self):
+        """Final RGB frame"""
+        return self.canvas.convert('RGB')
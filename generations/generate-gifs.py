@@ -4,24 +4,13 @@ x402 Protocol Pioneer NFT GIF Generator
 Python version - more reliable than Node.js canvas
 """
 
+import argparse
 import os
-from PIL import Image, ImageDraw, ImageFont
-import subprocess
-import sys
 
-def install_pillow():
-    """Install Pillow if not available"""
-    try:
-        import PIL
-    except ImportError:
-        print("Installing Pillow...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pillow"])
-        import PIL
+from PIL import Image, ImageDraw
 
-# Ensure Pillow is installed
-install_pillow()
-
-from PIL import Image, ImageDraw, ImageFont
+import font_registry
+from gif_stream import write_gif, write_gif_stream
 
 # Create output directory
 output_dir = "public/animations"
@@ -72,20 +61,10 @@ def draw_frame(config, frame_num, width=512, height=512):
     img = Image.new('RGB', (width, height), hex_to_rgb(config['bg']))
     draw = ImageDraw.Draw(img)
     
-    # Try to use a monospace font, fallback to default
-    try:
-        font_code = ImageFont.truetype("/System/Library/Fonts/Monaco.ttc", 16)
-        font_x = ImageFont.truetype("/System/Library/Fonts/Monaco.ttc", 120)
-        font_num = ImageFont.truetype("/System/Library/Fonts/Monaco.ttc", 60)
-    except:
-        try:
-            font_code = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 16)
-            font_x = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 120)
-            font_num = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", 60)
-        except:
-            font_code = ImageFont.load_default()
-            font_x = ImageFont.load_default()
-            font_num = ImageFont.load_default()
+    # Monospace fonts from the shared registry (falls back to default)
+    font_code = font_registry.get_font(16)
+    font_x = font_registry.get_font(120)
+    font_num = font_registry.get_font(60)
     
     # Gold border for Genesis
     if config.get('gold_border'):
@@ -207,43 +186,54 @@ def draw_frame(config, frame_num, width=512, height=512):
     
     return img
 
-def generate_gif(tier_name, config):
-    """Generate GIF for a tier"""
-    print(f"🎬 Generating {tier_name}.gif...")
-    
-    frames = []
-    
-    # Generate 60 frames (2 seconds at 30fps)
-    for frame in range(60):
+def iter_frames(config, frame_count=60):
+    """Yield frames in order"""
+    for frame in range(frame_count):
         img = draw_frame(config, frame)
-        frames.append(img)
         
         if frame % 10 == 0:
-            print(f"  Frame {frame + 1}/60 ({int((frame + 1) / 60 * 100)}%)")
+            print(f"  Frame {frame + 1}/{frame_count} ({int((frame + 1) / frame_count * 100)}%)")
+        
+        yield img
+
+def generate_gif(tier_name, config, stream=False):
+    """Generate GIF for a tier (stream=True encodes frames as they are rendered)"""
+    print(f"🎬 Generating {tier_name}.gif...")
+    
+    # Generate 60 frames (2 seconds at 30fps)
+    frames = iter_frames(config, 60)
     
-    # Save as GIF
+    # Save as GIF (delta-encoded: changed rectangles over the previous frame)
     output_path = os.path.join(output_dir, f"{tier_name}.gif")
-    frames[0].save(
-        output_path,
-        save_all=True,
-        append_images=frames[1:],
-        duration=33,  # 30fps
-        loop=0
-    )
+    if stream:
+        write_gif_stream(output_path, frames, duration=33, loop=0)  # 30fps
+    else:
+        write_gif(output_path, list(frames), duration=33, loop=0)  # 30fps
     
     file_size = os.path.getsize(output_path) // 1024
     print(f"✅ Generated {tier_name}.gif ({file_size}KB)")
     return output_path
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate x402 Protocol Pioneer tier GIFs")
+    parser.add_argument(
+        '--stream', action='store_true',
+        help="encode frames as they are rendered, keeping only a few in memory"
+    )
+    return parser.parse_args()
+
 def main():
     """Generate all GIFs"""
+    args = parse_args()
+    
     print("🚀 Starting x402 Protocol Pioneer GIF generation...\n")
     
     results = []
     
     for tier_name, config in tiers.items():
         try:
-            output_path = generate_gif(tier_name, config)
+            output_path = generate_gif(tier_name, config, args.stream)
             results.append((tier_name, output_path, True))
         except Exception as e:
             print(f"❌ Failed to generate {tier_name}: {e}")
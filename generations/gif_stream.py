@@ -0,0 +1,365 @@
+"""
+x402 Protocol Pioneer Streaming GIF Writer
+Writes an animated GIF one frame at a time, so memory stays bounded by a few
+frames no matter how long the animation is. Each frame is quantised and
+LZW-encoded by Pillow's own single-frame GIF encoder, then re-emitted as an
+image block (with its palette as a local colour table) of one animated GIF.
+Encoding and disk writes run on a background thread so they overlap with
+frame rendering.
+
+Frames are delta-encoded against the previous frame: only the changed
+rectangle is stored, unchanged pixels inside it are transparent, and every
+frame uses disposal 1 (leave in place) so it is drawn over its predecessor.
+Runs of identical frames (detected by content hash) are collapsed into one
+block whose delay is the sum of theirs.
+
+Writers may share a block cache: a changed rectangle whose before and after
+pixels were already encoded (e.g. by another token's GIF of the same tier)
+reuses that encoding instead of being quantised again.
+"""
+
+import hashlib
+import io
+import os
+import queue
+import struct
+import threading
+
+from PIL import Image, ImageChops
+
+# Frames buffered between the renderer and the writer thread
+DEFAULT_QUEUE_SIZE = 4
+
+# GIF disposal methods
+DISPOSAL_NONE = 0
+DISPOSAL_LEAVE = 1
+
+# Palette index reserved for "unchanged" pixels in delta frames
+TRANSPARENT_INDEX = 255
+
+# Queued in place of the end-of-frames None when the frame source failed
+_ABORT = object()
+
+
+def _skip_sub_blocks(data, pos):
+    """Position just past a chain of GIF data sub-blocks"""
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def encode_frame(frame, transparency=None, optimize=True):
+    """Quantise and encode one frame with Pillow, returning its image block parts
+
+    Returns (palette bytes, size, interlace flag, LZW data including the
+    minimum code size byte and terminating sub-block, transparency index).
+    """
+    if frame.mode != 'P':
+        frame = frame.convert('P', palette=Image.Palette.ADAPTIVE)
+
+    params = {'optimize': optimize}
+    if transparency is not None:
+        params['transparency'] = transparency
+
+    buf = io.BytesIO()
+    frame.save(buf, 'GIF', **params)
+    data = buf.getvalue()
+
+    # Header + logical screen descriptor (+ global colour table)
+    packed = data[10]
+    pos = 13
+    palette = b''
+    if packed & 0x80:
+        table_size = 3 * (2 << (packed & 0x07))
+        palette = data[pos:pos + table_size]
+        pos += table_size
+
+    transparency = None
+    while True:
+        block = data[pos]
+        if block == 0x21:
+            # Extension - keep the transparency index from a graphic control block
+            label = data[pos + 1]
+            if label == 0xF9 and data[pos + 3] & 0x01:
+                transparency = data[pos + 6]
+            pos = _skip_sub_blocks(data, pos + 2)
+        elif block == 0x2C:
+            width, height, flags = struct.unpack('<HHB', data[pos + 5:pos + 10])
+            pos += 10
+            if flags & 0x80:
+                table_size = 3 * (2 << (flags & 0x07))
+                palette = data[pos:pos + table_size]
+                pos += table_size
+            start = pos
+            pos = _skip_sub_blocks(data, pos + 1)
+            return palette, (width, height), flags & 0x40, data[start:pos], transparency
+        else:
+            raise ValueError(f"Unexpected GIF block 0x{block:02x}")
+
+
+def delta_frame(previous, frame):
+    """Sub-image of frame covering what changed since previous
+
+    Returns (P-mode image, offset, transparency index or None), or None when
+    the frames are identical. Pixels inside the changed rectangle that did not
+    change are set to the transparent index so the previous frame shows through.
+    """
+    diff = ImageChops.difference(frame, previous)
+    bbox = diff.getbbox()
+    if bbox is None:
+        return None
+
+    red, green, blue = diff.crop(bbox).split()
+    changed = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+    unchanged = changed.point(lambda v: 255 if v == 0 else 0)
+
+    # Keep one palette slot free for transparency
+    sub_image = frame.crop(bbox).convert('P', palette=Image.Palette.ADAPTIVE, colors=TRANSPARENT_INDEX)
+    if unchanged.getbbox() is None:
+        return sub_image, bbox[:2], None
+
+    sub_image.paste(TRANSPARENT_INDEX, mask=unchanged)
+    return sub_image, bbox[:2], TRANSPARENT_INDEX
+
+
+class GifStreamWriter:
+    """Incremental animated GIF writer
+
+    Usage:
+        with GifStreamWriter(path, (512, 512), loop=0) as writer:
+            for frame in frames:
+                writer.write(frame, duration=50)
+
+    With delta=True (the default) only the previous frame is kept, to encode
+    each new frame as the changed rectangle over it. With collapse=True (the
+    default) a frame identical to its predecessor (by content hash) is not
+    written at all; the predecessor's delay grows instead, so the last block
+    is held back until the next different frame or close().
+
+    A file path is written as path.tmp and only replaces path once close()
+    succeeds; abort() (or leaving the with block on an exception) deletes it,
+    so a failed render never leaves a truncated GIF behind.
+    """
+
+    def __init__(self, path, size, loop=0, delta=True, collapse=True, block_cache=None):
+        self.path = path
+        self.size = size
+        self.loop = loop
+        self.delta = delta
+        self.collapse = collapse
+        self.block_cache = block_cache
+        self.previous = None
+        self.previous_digest = None
+        self.pending = None
+        self.frame_count = 0
+        self.block_count = 0
+        # path may also be a writable binary file object, which is left open
+        self.owns_fp = not hasattr(path, 'write')
+        self.temp_path = f"{path}.tmp" if self.owns_fp else None
+        self.fp = open(self.temp_path, 'wb') if self.owns_fp else path
+        self.closed = False
+        self._write_header()
+
+    def _write_header(self):
+        width, height = self.size
+        # No global colour table - every frame carries its own palette
+        self.fp.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0x70, 0, 0))
+        if self.loop is not None:
+            self.fp.write(
+                b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00'
+            )
+
+    def write(self, frame, duration):
+        """Append one full-size frame (any mode Pillow can quantise) shown for duration ms"""
+        self.frame_count += 1
+        if self.delta and frame.mode != 'RGB':
+            frame = frame.convert('RGB')
+
+        if self.collapse:
+            digest = hashlib.blake2b(frame.tobytes(), digest_size=16).digest()
+            if self.pending is not None and digest == self.previous_digest:
+                # Same pixels as the previous frame - just show that one for longer
+                self.pending['delay'] += int(duration / 10)
+                return
+            self.previous_digest = digest
+
+        if not self.delta:
+            self._queue_block(encode_frame(frame), duration)
+            return
+
+        if self.previous is None:
+            self._queue_block(encode_frame(frame), duration, disposal=DISPOSAL_LEAVE)
+        else:
+            encoded, offset = self._encode_delta(frame)
+            self._queue_block(encoded, duration, offset=offset, disposal=DISPOSAL_LEAVE)
+        self.previous = frame
+
+    def _encode_delta(self, frame):
+        """Encoded changed rectangle of frame over the previous frame, and its offset"""
+        key = None
+        if self.block_cache is not None:
+            bbox = ImageChops.difference(frame, self.previous).getbbox()
+            if bbox is not None:
+                key = bbox + (hashlib.blake2b(
+                    self.previous.crop(bbox).tobytes() + frame.crop(bbox).tobytes(), digest_size=16
+                ).digest(),)
+                if key in self.block_cache:
+                    return self.block_cache[key]
+
+        delta = delta_frame(self.previous, frame)
+        if delta is None:
+            # Nothing changed (collapse disabled) - a single transparent pixel keeps the timing
+            sub_image, offset, transparency = Image.new('P', (1, 1), TRANSPARENT_INDEX), (0, 0), TRANSPARENT_INDEX
+        else:
+            sub_image, offset, transparency = delta
+        result = (encode_frame(sub_image, transparency), offset)
+
+        if key is not None:
+            self.block_cache[key] = result
+        return result
+
+    def _queue_block(self, encoded, duration, offset=(0, 0), disposal=DISPOSAL_NONE):
+        """Hold an encoded frame back until its final delay is known"""
+        self._flush_pending()
+        self.pending = {
+            'encoded': encoded,
+            'delay': int(duration / 10),
+            'offset': offset,
+            'disposal': disposal
+        }
+
+    def _flush_pending(self):
+        if self.pending is not None:
+            pending, self.pending = self.pending, None
+            self._write_block(*pending['encoded'], pending['delay'], pending['offset'], pending['disposal'])
+
+    def write_block(self, palette, size, interlace, image_data, transparency,
+                    duration, offset=(0, 0), disposal=DISPOSAL_NONE):
+        """Append an already-encoded frame (see encode_frame) shown for duration ms"""
+        self._flush_pending()
+        self.frame_count += 1
+        self._write_block(palette, size, interlace, image_data, transparency,
+                          int(duration / 10), offset, disposal)
+
+    def _write_block(self, palette, size, interlace, image_data, transparency,
+                     delay, offset, disposal):
+        # Graphic control extension: disposal, delay (1/100 s), transparency
+        packed = (disposal << 2) | (1 if transparency is not None else 0)
+        self.fp.write(
+            b'!\xf9\x04' + struct.pack('<BHB', packed, delay, transparency or 0) + b'\x00'
+        )
+
+        # Image descriptor with the frame's palette as its local colour table
+        table_bits = max(0, (len(palette) // 3).bit_length() - 2)
+        flags = 0x80 | interlace | table_bits
+        self.fp.write(b',' + struct.pack('<HHHHB', offset[0], offset[1], size[0], size[1], flags))
+        self.fp.write(palette)
+        self.fp.write(image_data)
+        self.block_count += 1
+
+    def close(self):
+        """Write any held-back frame and the trailer, then close the file and move it into place"""
+        if self.closed:
+            return
+        try:
+            self._flush_pending()
+            self.fp.write(b';')
+            if self.owns_fp:
+                self.fp.close()
+                os.replace(self.temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+        self.closed = True
+
+    def abort(self):
+        """Stop writing, deleting the unfinished file (a file object is left as it is)"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.owns_fp:
+            self.fp.close()
+            try:
+                os.remove(self.temp_path)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_gif(path, frames, duration, loop=0, delta=True, collapse=True, block_cache=None):
+    """Write frames to path on the calling thread. Returns the number of frames written."""
+    writer = None
+    try:
+        for frame in frames:
+            if writer is None:
+                writer = GifStreamWriter(path, frame.size, loop, delta, collapse, block_cache)
+            writer.write(frame, duration)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.close()
+    return writer.frame_count if writer else 0
+
+
+def write_gif_stream(path, frames, duration, loop=0, delta=True, collapse=True,
+                     queue_size=DEFAULT_QUEUE_SIZE):
+    """Write frames (any iterable, typically a generator) to path as they arrive
+
+    A background thread encodes and writes while the caller keeps rendering;
+    at most queue_size frames are held between the two. Returns the number of
+    frames written.
+    """
+    frame_queue = queue.Queue(maxsize=queue_size)
+    errors = []
+    writer = None
+
+    def consume():
+        nonlocal writer
+        try:
+            while True:
+                frame = frame_queue.get()
+                if frame is None or frame is _ABORT:
+                    break
+                if writer is None:
+                    writer = GifStreamWriter(path, frame.size, loop, delta, collapse)
+                writer.write(frame, duration)
+            if writer is not None:
+                if frame is _ABORT:
+                    writer.abort()
+                else:
+                    writer.close()
+        except Exception as e:
+            errors.append(e)
+            if writer is not None:
+                writer.abort()
+            # Keep draining so the producer never blocks on a dead consumer
+            while frame is not None and frame is not _ABORT:
+                frame = frame_queue.get()
+
+    thread = threading.Thread(target=consume, name='gif-stream-writer', daemon=True)
+    thread.start()
+    end = _ABORT
+    try:
+        for frame in frames:
+            if errors:
+                break
+            frame_queue.put(frame)
+        end = None
+    finally:
+        # The frames ran out (None) or their source raised (_ABORT: nothing is published)
+        frame_queue.put(end)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return writer.frame_count if writer else 0
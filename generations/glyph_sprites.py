@@ -0,0 +1,45 @@
+"""
+x402 Protocol Pioneer Glyph Sprite Cache
+Rasterises each (font, text) glyph mask once per process. Glows, trails and
+motion blur stamp the cached mask with a colour and opacity instead of asking
+FreeType to rasterise the same text again for every offset.
+"""
+
+from functools import lru_cache
+
+from PIL import Image, ImageDraw
+
+
+class GlyphSprite:
+    """Pre-rasterised 'L' mask of a piece of text
+
+    offset is the distance from the text origin (default 'la' anchor) to the
+    mask's top-left corner, so stamping at a text position matches draw.text.
+    """
+
+    def __init__(self, mask, offset):
+        self.mask = mask
+        self.offset = offset
+
+    @property
+    def size(self):
+        return self.mask.size
+
+    def box(self, xy, pad=0):
+        """Box covered by the sprite when stamped at text position xy"""
+        x = xy[0] + self.offset[0]
+        y = xy[1] + self.offset[1]
+        return (x - pad, y - pad, x + self.mask.width + pad, y + self.mask.height + pad)
+
+    def stamp(self, target, xy, fill):
+        """Blend the sprite in fill colour into target (an ImageDraw or CompositeLayer) at xy"""
+        target.bitmap((xy[0] + self.offset[0], xy[1] + self.offset[1]), self.mask, fill=fill)
+
+
+@lru_cache(maxsize=None)
+def get_sprite(font, text):
+    """Cached sprite for text in font (fonts come from the shared registry, so identity is stable)"""
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+    return GlyphSprite(mask, (left, top))
@@ -0,0 +1,215 @@
+"""
+x402 Protocol Pioneer Gradients
+Linear, radial and multi-stop gradient fills built as whole arrays and
+wrapped as Pillow images, instead of one draw call per row.
+
+A gradient is a list of stops, (position 0..1, colour), with 1, 3 or 4
+channel colours giving an 'L', 'RGB' or 'RGBA' image. Channels are
+interpolated linearly between neighbouring stops and truncated, exactly
+like the int(c0 + (c1 - c0) * t) row loops this replaces, so existing
+backgrounds are reproduced pixel for pixel.
+
+With NumPy available any size (4K/8K included) is a few array operations,
+computed in bands of rows (TILE_PIXELS at a time, or fewer within
+tile_limit) so that the float temporaries stay bounded however large the
+image. Without it, axis-aligned linear gradients are still built from a
+single row or column of colours; other shapes fall back to a per-pixel loop.
+
+Usage:
+    img = linear_gradient((2560, 1440), [(0, (0, 0, 255)), (1, (50, 53, 61))])
+    glow = radial_gradient((1200, 400), [(0, (255, 209, 47, 96)), (1, (255, 209, 47, 0))])
+"""
+
+import contextlib
+import math
+
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # Optional - axis-aligned gradients need only Pillow
+    np = None
+
+# Set to False to force the pure-Pillow path (e.g. to compare output)
+USE_NUMPY = np is not None
+
+MODES = {1: 'L', 3: 'RGB', 4: 'RGBA'}
+
+# Two-dimensional gradients look colours up in a table this fine (far more
+# steps than an 8-bit channel can show) instead of interpolating per pixel
+GRADIENT_STEPS = 4096  # Fits the uint16 table index
+
+# Pixels a two-dimensional gradient computes at once: each costs about
+# TILE_BYTES_PER_PIXEL of temporaries. tile_limit lowers it for a build under
+# a memory budget (see memory_budget); the result is the same either way.
+TILE_PIXELS = 1 << 22
+TILE_BYTES_PER_PIXEL = 32
+
+
+@contextlib.contextmanager
+def tile_limit(pixels):
+    """Compute two-dimensional gradients at most pixels at a time within the block"""
+    global TILE_PIXELS
+    previous = TILE_PIXELS
+    TILE_PIXELS = min(previous, pixels)
+    try:
+        yield
+    finally:
+        TILE_PIXELS = previous
+
+
+def normalize_stops(stops):
+    """Stops sorted by position, with colours as tuples of equal length
+
+    A plain list of colours is spread evenly from 0 to 1.
+    """
+    stops = list(stops)
+    if not stops:
+        raise ValueError("A gradient needs at least one stop")
+    if not all(len(stop) == 2 and isinstance(stop[1], (tuple, list)) for stop in stops):
+        # Colours only
+        last = max(len(stops) - 1, 1)
+        stops = [(index / last, color) for index, color in enumerate(stops)]
+
+    stops = sorted((float(position), tuple(color)) for position, color in stops)
+    channels = len(stops[0][1])
+    if channels not in MODES or any(len(color) != channels for _, color in stops):
+        raise ValueError("Gradient colours must all have 1, 3 or 4 channels")
+    return stops
+
+
+def color_at(stops, t):
+    """Colour of the gradient at position t (pure Python)"""
+    if t <= stops[0][0]:
+        return stops[0][1]
+    for (p0, c0), (p1, c1) in zip(stops, stops[1:]):
+        if t <= p1:
+            local = (t - p0) / (p1 - p0) if p1 > p0 else 1.0
+            return tuple(int(a + (b - a) * local) for a, b in zip(c0, c1))
+    return stops[-1][1]
+
+
+def colors_at(stops, t):
+    """Colours of the gradient at every position in the array t, as uint8 (..., channels)"""
+    positions = [position for position, _ in stops]
+    channels = [
+        np.interp(t, positions, [color[channel] for _, color in stops])
+        for channel in range(len(stops[0][1]))
+    ]
+    return np.stack(channels, axis=-1).astype(np.uint8)
+
+
+def lookup_colors(stops, t, steps):
+    """colors_at for large arrays: t quantised to a table of steps colours"""
+    return _lookup(colors_at(stops, np.linspace(0.0, 1.0, steps)), t)
+
+
+def _lookup(table, t):
+    steps = len(table)
+    index = np.clip(t * (steps - 1) + 0.5, 0, steps - 1).astype(np.uint16)
+    return table[index]
+
+
+def _tiled_image(size, stops, rows_t):
+    """
+    Gradient image from rows_t(y0, y1) -> t for rows y0..y1-1, a band of
+    about TILE_PIXELS pixels at a time
+    """
+    width, height = size
+    table = colors_at(stops, np.linspace(0.0, 1.0, GRADIENT_STEPS))
+    pixels = np.empty((height, width, table.shape[-1]), dtype=np.uint8)
+    band = max(1, TILE_PIXELS // max(width, 1))
+    for y0 in range(0, height, band):
+        y1 = min(height, y0 + band)
+        pixels[y0:y1] = _lookup(table, rows_t(y0, y1))
+    return _image(pixels)
+
+
+def _image(array):
+    """Pillow image from a uint8 (height, width, channels) array"""
+    channels = array.shape[-1]
+    if channels == 1:
+        array = array[..., 0]
+    return Image.fromarray(np.ascontiguousarray(array), MODES[channels])
+
+
+def _strip(colors, vertical):
+    """1-pixel strip of colours (a column if vertical, else a row)"""
+    mode = MODES[len(colors[0])]
+    size = (1, len(colors)) if vertical else (len(colors), 1)
+    strip = Image.new(mode, size)
+    strip.putdata(colors if mode != 'L' else [color[0] for color in colors])
+    return strip
+
+
+def linear_gradient(size, stops, angle=0):
+    """
+    Linear gradient image of size (width, height)
+    angle is in degrees: 0 runs top to bottom, 90 left to right, 180 bottom
+    to top, and so on. Position t is the pixel's offset along that direction
+    divided by the image's extent in it, so the first row (or column) is at
+    0 and the last just short of 1 - matching the y / height row loops.
+    """
+    width, height = size
+    stops = normalize_stops(stops)
+    radians = math.radians(angle)
+    dx, dy = round(math.sin(radians), 12), round(math.cos(radians), 12)
+
+    # Axis-aligned: one row or column of colours, stretched
+    if dx == 0 or dy == 0:
+        vertical = dx == 0
+        length = height if vertical else width
+        reverse = (dy if vertical else dx) < 0
+        if USE_NUMPY:
+            t = np.arange(length, dtype=np.float64) / length
+            colors = colors_at(stops, t[::-1] if reverse else t)
+            shape = (length, 1, colors.shape[-1]) if vertical else (1, length, colors.shape[-1])
+            strip = _image(colors.reshape(shape))
+        else:
+            t = [index / length for index in range(length)]
+            strip = _strip([color_at(stops, value) for value in (t[::-1] if reverse else t)], vertical)
+        return strip.resize((width, height), Image.Resampling.NEAREST)
+
+    extent = abs(dx) * width + abs(dy) * height
+    origin_x = width - 1 if dx < 0 else 0
+    origin_y = height - 1 if dy < 0 else 0
+
+    if USE_NUMPY:
+        xs = (np.arange(width, dtype=np.float32) - origin_x) * (dx / extent)
+        ys = (np.arange(height, dtype=np.float32) - origin_y) * (dy / extent)
+        return _tiled_image(size, stops, lambda y0, y1: ys[y0:y1, np.newaxis] + xs[np.newaxis, :])
+
+    return _fill_pixels(size, stops, lambda x, y: ((x - origin_x) * dx + (y - origin_y) * dy) / extent)
+
+
+def radial_gradient(size, stops, center=None, radius=None):
+    """
+    Radial gradient image of size (width, height)
+    Position t is the distance from center (default: the middle) divided by
+    radius (default: the distance to the farthest corner).
+    """
+    width, height = size
+    stops = normalize_stops(stops)
+    cx, cy = center if center is not None else (width / 2, height / 2)
+    if radius is None:
+        radius = max(math.hypot(corner_x - cx, corner_y - cy)
+                     for corner_x in (0, width) for corner_y in (0, height)) or 1.0
+
+    if USE_NUMPY:
+        xs = (np.arange(width, dtype=np.float32) + 0.5 - cx) ** 2
+        ys = (np.arange(height, dtype=np.float32) + 0.5 - cy) ** 2
+        return _tiled_image(
+            size, stops, lambda y0, y1: np.sqrt(ys[y0:y1, np.newaxis] + xs[np.newaxis, :]) * (1.0 / radius)
+        )
+
+    return _fill_pixels(size, stops, lambda x, y: math.hypot(x + 0.5 - cx, y + 0.5 - cy) / radius)
+
+
+def _fill_pixels(size, stops, position):
+    """Gradient image with position(x, y) -> t evaluated per pixel (no NumPy)"""
+    width, height = size
+    mode = MODES[len(stops[0][1])]
+    colors = [color_at(stops, position(x, y)) for y in range(height) for x in range(width)]
+    img = Image.new(mode, size)
+    img.putdata(colors if mode != 'L' else [color[0] for color in colors])
+    return img
@@ -0,0 +1,234 @@
+"""
+x402 Protocol Pioneer Memory Budget
+Peak-memory accounting per asset, and the render settings that keep a
+build under a memory limit (e.g. a small CI container).
+
+Peak RSS is what gets a process OOM-killed, so that is what is reported.
+On Linux the kernel's high-water mark (VmHWM) is reset before each asset,
+giving every asset its own peak; elsewhere only the process-wide
+ru_maxrss is available, so an asset's peak is the highest seen so far.
+Pillow allocates image buffers outside the Python heap, so tracemalloc
+(opt-in: it slows rendering by ~40%) shows only the Python-side peak.
+
+With a budget, each animation gets the fastest settings whose estimated
+peak fits: the requested worker pool holding frames in memory, then
+streaming encoding, then fewer workers. Two-dimensional gradients are
+rendered in smaller tiles (see gradients.TILE_PIXELS).
+
+Usage:
+    memory = MemoryTracker(budget=parse_size("512M"))
+    plan = memory.plan_animation(workers=4)
+    with memory.track("genesis.gif", plan.workers):
+        generate_gif('genesis', config, plan.workers, plan.stream)
+    memory.print_report()
+"""
+
+import contextlib
+import os
+import re
+import resource
+import sys
+import tracemalloc
+from collections import namedtuple
+
+MB = 1024 * 1024
+
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': MB, 'MB': MB, 'G': 1024 * MB, 'GB': 1024 * MB}
+
+# Rough costs for planning, measured on a 512x512 tier animation
+ENCODE_RSS = 24 * MB        # GIF encoder working set (palettes, deltas, output blocks)
+WORKER_RSS = 40 * MB        # One pool worker with Pillow, fonts and sprites loaded
+STREAM_FRAMES = 6           # Frames alive while streaming (queue plus in flight)
+
+# Of the budget, the share plans may use (the estimates are approximate)
+BUDGET_HEADROOM = 0.85
+
+# Animation settings: workers, stream, estimated peak bytes (parent plus workers), fits
+AnimationPlan = namedtuple('AnimationPlan', 'workers stream estimate fits')
+
+# name: asset, peak_rss: peak bytes of this process while it was built,
+# start_rss: bytes when it started, python_peak: tracemalloc peak bytes (or None),
+# workers: pool size, worker_peak_rss: largest pool worker's peak bytes (or None)
+AssetMemory = namedtuple('AssetMemory', 'name peak_rss start_rss python_peak workers worker_peak_rss')
+
+
+def parse_size(value):
+    """Bytes from a size such as 512M, 1.5G, 300MB or 1048576"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*', str(value), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"invalid size {value!r} (expected e.g. 512M or 2G)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size):
+    return f"{size / MB:.1f}MB" if size is not None else "-"
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process so far, in KB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _children_peak_rss():
+    """Largest peak RSS of any finished child process, in bytes (0 if none)"""
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _proc_status(field):
+    """A kB field of /proc/self/status in bytes, or None off Linux"""
+    try:
+        with open('/proc/self/status') as f:
+            match = re.search(rf'^{field}:\s+(\d+) kB', f.read(), re.MULTILINE)
+    except OSError:
+        return None
+    return int(match.group(1)) * 1024 if match else None
+
+
+def current_rss():
+    """Resident set size of this process now, in bytes (None if unknown)"""
+    return _proc_status('VmRSS')
+
+
+def reset_peak_rss():
+    """Restart the kernel's peak RSS tracking at the current RSS; True if supported (Linux)"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss():
+    """Peak RSS since the last reset_peak_rss (or process start), in bytes"""
+    peak = _proc_status('VmHWM')
+    return peak if peak is not None else peak_rss_kb() * 1024
+
+
+def describe_plan(plan):
+    """One-line summary of an animation plan"""
+    encode = "streaming encode" if plan.stream else "frames held for encode"
+    workers = f"{plan.workers} workers" if plan.workers > 1 else "1 worker"
+    warning = " - ⚠️  over budget even so" if not plan.fits else ""
+    return f"🧠 {workers}, {encode} (~{format_size(plan.estimate)} estimated peak){warning}"
+
+
+def animation_estimate(workers, stream, frame_count=100, frame_size=(512, 512), start_rss=0):
+    """Estimated peak bytes of rendering and encoding an animation, pool workers included"""
+    frame_bytes = frame_size[0] * frame_size[1] * 3
+    held_frames = min(frame_count, STREAM_FRAMES) if stream else frame_count
+    estimate = start_rss + ENCODE_RSS + held_frames * frame_bytes
+    if workers > 1:
+        # Each worker, plus the shared-memory ring of two frames per worker
+        estimate += workers * (WORKER_RSS + 2 * frame_bytes)
+    return estimate
+
+
+class MemoryTracker:
+    """Peak memory of each asset built, and settings planned against an optional budget"""
+
+    def __init__(self, budget=None, trace_python=False):
+        self.budget = budget
+        self.trace_python = trace_python
+        self.records = []
+        # Whether peaks are per asset: track() finds out when it resets the high-water mark
+        self.exact = True
+
+    def _start_rss(self):
+        rss = current_rss()
+        return rss if rss is not None else peak_rss_kb() * 1024
+
+    def plan_animation(self, workers=1, stream=False, can_stream=True, frame_count=100, frame_size=(512, 512)):
+        """
+        Settings for an animation: the requested ones without a budget,
+        otherwise the fastest whose estimated peak fits. Encoders that need
+        the whole sequence (WebP, APNG) pass can_stream=False. If nothing
+        fits, the leanest settings are returned with fits=False.
+        """
+        workers = workers or os.cpu_count()
+        start_rss = self._start_rss()
+
+        def plan(workers, stream):
+            estimate = animation_estimate(workers, stream, frame_count, frame_size, start_rss)
+            return AnimationPlan(workers, stream, estimate, self.budget is None or estimate <= self.budget * BUDGET_HEADROOM)
+
+        if self.budget is None:
+            return plan(workers, stream)
+
+        candidates = [(workers, stream)]
+        if can_stream:
+            candidates.append((workers, True))
+        pool_sizes = [workers]
+        while pool_sizes[-1] > 1:
+            pool_sizes.append(pool_sizes[-1] // 2)
+        candidates += [(size, can_stream) for size in pool_sizes[1:]]
+
+        for settings in candidates:
+            candidate = plan(*settings)
+            if candidate.fits:
+                return candidate
+        return candidate
+
+    def gradient_tile_pixels(self):
+        """Pixels a gradient tile may cover to use at most a tenth of the free budget (None without one)"""
+        if self.budget is None:
+            return None
+        free = max(self.budget * BUDGET_HEADROOM - self._start_rss(), 0)
+        from gradients import TILE_BYTES_PER_PIXEL
+        return max(int(free / 10 / TILE_BYTES_PER_PIXEL), 1)
+
+    @contextlib.contextmanager
+    def track(self, name, workers=1):
+        """Record the peak memory of building asset name (rendered with workers processes)"""
+        start_rss = self._start_rss()
+        # Without a resettable high-water mark, peaks are process-wide so far
+        self.exact = reset_peak_rss()
+        workers_before = _children_peak_rss()
+
+        tracing = self.trace_python and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_python:
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            python_peak = tracemalloc.get_traced_memory()[1] if self.trace_python else None
+            if tracing:
+                tracemalloc.stop()
+            # Children's peak is process-wide: only attributable if this asset raised it
+            worker_peak = _children_peak_rss() if workers > 1 else 0
+            self.records.append(AssetMemory(
+                name, peak_rss(), start_rss, python_peak, workers,
+                worker_peak if worker_peak > workers_before else None
+            ))
+
+    def total_peak(self, record):
+        """Estimated peak bytes of an asset, pool workers included"""
+        return record.peak_rss + (record.worker_peak_rss or 0) * (record.workers if record.workers > 1 else 0)
+
+    def over_budget(self):
+        """Records whose peak exceeded the budget"""
+        if self.budget is None:
+            return []
+        return [record for record in self.records if self.total_peak(record) > self.budget]
+
+    def print_report(self):
+        """Print each asset's peak memory"""
+        if not self.records:
+            return
+
+        budget = f", budget {format_size(self.budget)}" if self.budget is not None else ""
+        print(f"🧠 Peak memory per asset (RSS{budget})")
+        print(f"   {'asset':<30} {'peak':>10} {'growth':>10} {'python':>10} {'workers':>14}")
+        for record in self.records:
+            workers = f"{record.workers} x {format_size(record.worker_peak_rss)}" if record.workers > 1 else "-"
+            python_peak = format_size(record.python_peak) if record.python_peak is not None else "-"
+            flag = "  ⚠️  over budget" if record in self.over_budget() else ""
+            print(f"   {record.name:<30} {format_size(record.peak_rss):>10} "
+                  f"{format_size(record.peak_rss - record.start_rss):>10} {python_peak:>10} {workers:>14}{flag}")
+        if not self.exact:
+            print("   ⚠️  Peaks are process-wide high-water marks on this platform")
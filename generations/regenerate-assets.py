@@ -4,112 +4,167 @@ x402 Protocol Pioneer Asset Regenerator - OFFICIAL BASE BRAND COLORS
 Regenerates all collection assets with the new official Base brand colors
 """
 
+import argparse
 import os
-import subprocess
+import shutil
 import sys
-from datetime import datetime
+import tempfile
 
-def run_command(command, description):
-    """Run a command and report results"""
-    print(f"\n🔄 {description}...")
-    print(f"Running: {command}")
-    
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print(f"✅ {description} completed successfully!")
-            if result.stdout.strip():
-                print("Output:", result.stdout.strip())
-        else:
-            print(f"❌ {description} failed!")
-            if result.stderr.strip():
-                print("Error:", result.stderr.strip())
-            return False
-            
-    except Exception as e:
-        print(f"❌ {description} failed with exception: {e}")
-        return False
-    
-    return True
+import asset_library
+import asset_manifest
+import backup_store
+import memory_budget
+from dependencies import require_dependencies
+
+# Directories holding generated assets (backed up before each rebuild)
+ASSET_DIRS = ["public/images", "public/animations"]
 
 def backup_existing_assets():
-    """Backup existing assets before regenerating"""
+    """Backup existing assets before regenerating
+    
+    Files go into a content-addressed store, so unchanged assets are never
+    copied twice; each run only adds a small snapshot index.
+    """
     print("\n📦 Creating backup of existing assets...")
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = f"backup_assets_{timestamp}"
+    store = backup_store.BackupStore()
+    sources = [source_dir for source_dir in ASSET_DIRS if os.path.exists(source_dir)]
+    snapshot_id, file_count, stored = store.snapshot(sources)
     
-    # Create backup directory
-    os.makedirs(backup_dir, exist_ok=True)
+    print(f"✅ Backup snapshot {snapshot_id}: {file_count} files, {stored} new")
+    return snapshot_id
+
+def list_backups():
+    """Show the backup snapshots available for restore"""
+    store = backup_store.BackupStore()
+    snapshot_ids = store.snapshots()
+    
+    if not snapshot_ids:
+        print("📦 No backup snapshots yet")
+        return True
+    
+    print("📦 Backup snapshots:")
+    for snapshot_id in snapshot_ids:
+        snapshot = store.load_snapshot(snapshot_id)
+        print(f"  • {snapshot_id} - {len(snapshot['files'])} files")
+    print(f"💾 Store size: {store.disk_usage() // 1024}KB")
+    return True
+
+def restore_backup(snapshot_id):
+    """Restore assets from a backup snapshot"""
+    print(f"\n♻️  Restoring backup snapshot {snapshot_id}...")
     
-    # Backup directories
-    for source_dir in ["public/images", "public/animations"]:
-        if os.path.exists(source_dir):
-            backup_path = os.path.join(backup_dir, source_dir.replace("/", "_"))
-            run_command(f"cp -r {source_dir} {backup_path}", f"Backup {source_dir}")
+    try:
+        written = backup_store.BackupStore().restore(snapshot_id)
+    except FileNotFoundError as e:
+        print(f"❌ Restore failed: {e}")
+        return False
     
-    print(f"✅ Backup created in: {backup_dir}")
-    return backup_dir
+    print(f"✅ Restored {written} changed files")
+    return True
 
-def verify_scripts_exist():
-    """Verify all required scripts exist"""
-    print("\n🔍 Verifying required scripts exist...")
+def prune_backups(keep):
+    """Drop old backup snapshots and the file contents only they referenced"""
+    print(f"\n🧹 Pruning backups, keeping the newest {keep} snapshots...")
     
-    required_scripts = [
-        "generate-collection-banner.py",
-        "generate-gifs-improved.py", 
-        "generate-png-improved.py"
-    ]
+    snapshots_removed, objects_removed = backup_store.BackupStore().prune(keep)
     
-    missing_scripts = []
-    for script in required_scripts:
-        if not os.path.exists(script):
-            missing_scripts.append(script)
+    print(f"✅ Removed {snapshots_removed} snapshots and {objects_removed} stored files")
+    return True
+
+def verify_scripts_exist():
+    """Verify all renderer modules exist"""
+    print("\n🔍 Verifying renderer modules exist...")
+    
+    missing_modules = []
+    for group in asset_library.ASSET_GROUPS:
+        path = asset_library.module_path(group)
+        if not os.path.exists(path):
+            missing_modules.append(os.path.basename(path))
         else:
-            print(f"✅ Found: {script}")
+            print(f"✅ Found: {os.path.basename(path)}")
     
-    if missing_scripts:
-        print(f"❌ Missing scripts: {missing_scripts}")
+    if missing_modules:
+        print(f"❌ Missing modules: {missing_modules}")
         return False
     
-    print("✅ All required scripts found!")
+    print("✅ All renderer modules found!")
     return True
 
-def install_dependencies():
-    """Install required Python dependencies"""
-    print("\n📦 Installing Python dependencies...")
-    
-    dependencies = ["pillow"]
-    
-    for dep in dependencies:
-        success = run_command(
-            f"{sys.executable} -m pip install {dep}", 
-            f"Installing {dep}"
-        )
-        if not success:
-            print(f"⚠️  Warning: Failed to install {dep}")
-
-def regenerate_collection_banner():
-    """Regenerate the collection banner with official Base colors"""
-    return run_command(
-        f"{sys.executable} generate-collection-banner.py",
-        "Generating collection banner with official Base colors"
-    )
+def pillow_version():
+    """Installed Pillow version, or None if Pillow is missing"""
+    try:
+        from PIL import __version__
+    except ImportError:
+        return None
+    return __version__
 
-def regenerate_gifs():
-    """Regenerate all GIF animations with official Base colors"""
-    return run_command(
-        f"{sys.executable} generate-gifs-improved.py",
-        "Generating GIF animations with official Base colors"
-    )
+def plan_assets(manifest, force=False):
+    """Work out which outputs need regenerating
+    
+    Returns (plan, number of outputs checked). The plan has one entry per
+    asset group with stale outputs: (group, stale tiers, {output path: inputs hash}).
+    """
+    import font_registry
+    
+    font_paths = font_registry.resolved_font_paths()
+    version = pillow_version()
+    
+    plan = []
+    checked = 0
+    for group, spec in asset_library.ASSET_GROUPS.items():
+        inputs = asset_manifest.ScriptInputs(asset_library.module_path(group), font_paths, version)
+        stale_tiers = []
+        stale_outputs = {}
+        
+        for tier in (list(inputs.tiers) or [None]):
+            outputs = [os.path.join(spec.output_dir, pattern.format(tier=tier)) for pattern in spec.outputs]
+            inputs_hash = inputs.inputs_hash(tier)
+            checked += len(outputs)
+            if force or not all(manifest.is_current(output, inputs_hash) for output in outputs):
+                if tier is not None:
+                    stale_tiers.append(tier)
+                stale_outputs.update((output, inputs_hash) for output in outputs)
+        
+        if stale_outputs:
+            plan.append((group, stale_tiers, stale_outputs))
+    
+    return plan, checked
 
-def regenerate_pngs():
-    """Regenerate all PNG static images with official Base colors"""
-    return run_command(
-        f"{sys.executable} generate-png-improved.py",
-        "Generating PNG static images with official Base colors"
-    )
+def regenerate_group(group, tiers, outputs, manifest, memory):
+    """Rebuild one asset group's stale outputs and move only changed files into place
+    
+    The group renders in this process into a scratch directory next to the
+    assets; each file replaces the published one only if its bytes differ, so
+    unchanged assets keep their mtime (and CDN ETag).
+    """
+    description = asset_library.ASSET_GROUPS[group].description
+    print(f"\n🔄 Generating {description} with official Base colors...")
+    
+    staging_dir = tempfile.mkdtemp(prefix=".asset-build-", dir=".")
+    try:
+        try:
+            asset_library.build_group(group, tiers, staging_dir, memory=memory)
+        except Exception as e:
+            print(f"❌ Generating {description} failed: {e}")
+            return False
+        
+        for output, inputs_hash in outputs.items():
+            staged_path = os.path.join(staging_dir, os.path.basename(output))
+            if not os.path.exists(staged_path):
+                print(f"❌ {group} did not produce {os.path.basename(output)}")
+                return False
+            if asset_manifest.publish(staged_path, output):
+                print(f"📝 Updated: {output}")
+            else:
+                print(f"⏸️  Unchanged: {output}")
+            manifest.record(output, inputs_hash)
+        
+        print(f"✅ Generating {description} completed successfully!")
+        return True
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        manifest.save()
 
 def verify_generated_assets():
     """Verify all assets were generated successfully"""
@@ -149,7 +204,7 @@ def verify_generated_assets():
             print(f"  • {missing}")
         return False
     
-    print(f"\n✅ All assets generated successfully!")
+    print("\n✅ All assets generated successfully!")
     print(f"📊 Total size: {total_size}KB")
     return True
 
@@ -172,7 +227,7 @@ def update_brand_colors_summary():
     for name, change, status in color_changes:
         print(f"  • {name}: {change} - {status}")
     
-    print(f"\n📁 Updated Files:")
+    print("\n📁 Updated Files:")
     updated_files = [
         "src/app/globals.css - CSS custom properties",
         "src/lib/cdp-theme.ts - CDP wallet theme",
@@ -186,7 +241,7 @@ def update_brand_colors_summary():
     for file in updated_files:
         print(f"  • {file}")
     
-    print(f"\n🌟 Benefits:")
+    print("\n🌟 Benefits:")
     benefits = [
         "Fully aligned with Base's official brand guidelines",
         "More vibrant and recognizable Base blue (#0000FF)",
@@ -198,60 +253,117 @@ def update_brand_colors_summary():
     for benefit in benefits:
         print(f"  • {benefit}")
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Regenerate x402 Protocol Pioneer collection assets")
+    parser.add_argument(
+        '--full', action='store_true',
+        help="rebuild every asset even if its inputs are unchanged"
+    )
+    parser.add_argument(
+        '--check', action='store_true',
+        help="only report stale assets (exit status 1 if any need regenerating)"
+    )
+    parser.add_argument(
+        '--memory-budget', type=memory_budget.parse_size, metavar='SIZE',
+        help="keep peak memory under SIZE (e.g. 512M): stream GIF encoding, use fewer "
+             "workers and render gradients in smaller tiles as needed"
+    )
+    parser.add_argument(
+        '--tracemalloc', action='store_true',
+        help="also report each asset's peak Python heap (slower)"
+    )
+    parser.add_argument(
+        '--list-backups', action='store_true',
+        help="list backup snapshots and exit"
+    )
+    parser.add_argument(
+        '--restore', metavar='SNAPSHOT',
+        help="restore assets from a backup snapshot and exit"
+    )
+    parser.add_argument(
+        '--prune-backups', type=int, metavar='KEEP',
+        help="keep only the newest KEEP backup snapshots and exit"
+    )
+    return parser.parse_args()
+
 def main():
     """Main regeneration process"""
+    args = parse_args()
+    
+    if args.list_backups:
+        return list_backups()
+    if args.restore:
+        return restore_backup(args.restore)
+    if args.prune_backups is not None:
+        return prune_backups(args.prune_backups)
+    
     print("🚀 x402 PROTOCOL PIONEER ASSET REGENERATOR")
     print("🎨 UPDATING TO OFFICIAL BASE BRAND COLORS")
     print("="*60)
     
     # Step 1: Verify environment
     if not verify_scripts_exist():
-        print("\n❌ Cannot proceed - missing required scripts")
+        print("\n❌ Cannot proceed - missing renderer modules")
         return False
     
-    # Step 2: Install dependencies
-    install_dependencies()
+    # Step 2: Check dependencies (never installs anything itself)
+    require_dependencies()
     
-    # Step 3: Create backup
-    backup_dir = backup_existing_assets()
+    # Step 3: Find assets whose inputs changed since the last build
+    manifest = asset_manifest.AssetManifest()
+    plan, checked = plan_assets(manifest, args.full)
     
-    # Step 4: Regenerate all assets
-    print("\n🎨 Regenerating all assets with official Base brand colors...")
+    if not plan:
+        print(f"\n✅ All {checked} assets are up to date - nothing to regenerate")
+        return args.check or verify_generated_assets()
     
-    success_count = 0
-    total_tasks = 3
+    stale_count = sum(len(outputs) for _, _, outputs in plan)
+    print(f"\n🔎 {stale_count}/{checked} assets need regenerating")
+    
+    if args.check:
+        for _, _, outputs in plan:
+            for output in outputs:
+                print(f"  • {output}")
+        return False
+    
+    # Step 4: Create backup
+    snapshot_id = backup_existing_assets()
     
-    if regenerate_collection_banner():
-        success_count += 1
+    # Step 5: Regenerate stale assets
+    print("\n🎨 Regenerating changed assets with official Base brand colors...")
     
-    if regenerate_gifs():
-        success_count += 1
+    success_count = 0
+    total_tasks = len(plan)
+    memory = memory_budget.MemoryTracker(args.memory_budget, args.tracemalloc)
     
-    if regenerate_pngs():
-        success_count += 1
+    for group, tiers, outputs in plan:
+        if regenerate_group(group, tiers, outputs, manifest, memory):
+            success_count += 1
     
-    # Step 5: Verify results
+    # Step 6: Verify results
     print(f"\n📊 Regeneration completed: {success_count}/{total_tasks} tasks successful")
+    memory.print_report()
     
     if success_count == total_tasks:
         if verify_generated_assets():
             print("\n🎉 SUCCESS: All assets regenerated with official Base brand colors!")
             update_brand_colors_summary()
             
-            print(f"\n📋 Next Steps:")
-            print(f"1. Review the updated assets in public/images/ and public/animations/")
-            print(f"2. Test the updated colors in your application")
-            print(f"3. Deploy the updated assets to your platform")
-            print(f"4. Update any documentation referencing the old colors")
-            print(f"5. Backup available in: {backup_dir}")
+            print("\n📋 Next Steps:")
+            print("1. Review the updated assets in public/images/ and public/animations/")
+            print("2. Test the updated colors in your application")
+            print("3. Deploy the updated assets to your platform")
+            print("4. Update any documentation referencing the old colors")
+            print(f"5. Previous assets can be restored with: --restore {snapshot_id}")
             
             return True
         else:
             print("\n⚠️  Assets generated but some files are missing")
             return False
     else:
-        print(f"\n❌ Some regeneration tasks failed. Check the logs above.")
-        print(f"💾 Your original assets are backed up in: {backup_dir}")
+        print("\n❌ Some regeneration tasks failed. Check the logs above.")
+        print(f"💾 Restore your original assets with: {sys.argv[0]} --restore {snapshot_id}")
         return False
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+x402 Protocol Pioneer Render Server
+Serves token artwork on demand from a local asyncio HTTP server:
+
+    GET /render/{tokenId}.png
+    GET /render/{tokenId}.gif
+
+Tokens are rendered on first request and then served from an LRU memory
+cache backed by a disk cache, with ETags for conditional requests. Runs
+fully locally, so it can be load tested before anything is deployed.
+"""
+
+import argparse
+import asyncio
+
+from dependencies import require_dependencies
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Serve x402 Protocol Pioneer token images on demand")
+    parser.add_argument(
+        '--host', default='127.0.0.1',
+        help="address to listen on (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        '--port', type=int, default=8402,
+        help="port to listen on (default: 8402)"
+    )
+    parser.add_argument(
+        '--cache-dir', default='.render-cache',
+        help="disk cache directory; '' disables the disk cache (default: .render-cache)"
+    )
+    parser.add_argument(
+        '--memory-cache-mb', type=float, default=64,
+        help="memory cache size in MB (default: 64)"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=0,
+        help="render threads, 0 = one per CPU (default: 0)"
+    )
+    return parser.parse_args()
+
+def main():
+    """Run the render server until interrupted"""
+    args = parse_args()
+    
+    # Pillow is only imported once there is work to do
+    require_dependencies()
+    import render_service
+    
+    def ready(server):
+        for sock in server.sockets:
+            host, port = sock.getsockname()[:2]
+            print(f"🚀 Render server listening on http://{host}:{port}")
+        print(f"   Try: /render/1.png, /render/402.gif (cache: {args.cache_dir or 'memory only'})")
+    
+    try:
+        asyncio.run(render_service.serve(
+            args.host, args.port, args.cache_dir,
+            int(args.memory_cache_mb * 1024 * 1024), args.workers or None, ready
+        ))
+    except KeyboardInterrupt:
+        print("\n👋 Render server stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+x402 Protocol Pioneer Render Graph
+Composite assets described as a dependency graph of named render nodes.
+Each node's result is computed on first use and memoized, so a sub-image
+shared by several composites (a logo, a background plate) is rendered once.
+
+Usage:
+    graph = RenderGraph()
+    graph.add('logo', lambda: create_logo_square(256))
+    graph.add('card', lambda logo: compose(logo), 'logo')
+    graph.get('card')   # renders 'logo' once, then 'card'
+
+Results are shared between every consumer, so a node that draws on a
+dependency's image must copy it first.
+"""
+
+
+class RenderGraph:
+    """Named render nodes with memoized results"""
+
+    def __init__(self):
+        self.nodes = {}
+        self.results = {}
+        self.render_counts = {}
+
+    def add(self, name, render, *dependencies):
+        """Register render(*dependency results) as node name"""
+        if name in self.nodes:
+            raise ValueError(f"Render node {name!r} already defined")
+        self.nodes[name] = (render, dependencies)
+
+    def get(self, name):
+        """Result of node name, rendering it (and its dependencies) on first use"""
+        return self._get(name, ())
+
+    def _get(self, name, path):
+        if name in self.results:
+            return self.results[name]
+        if name in path:
+            raise ValueError(f"Render graph cycle: {' -> '.join(path + (name,))}")
+        if name not in self.nodes:
+            raise KeyError(f"Unknown render node {name!r}")
+
+        render, dependencies = self.nodes[name]
+        inputs = [self._get(dependency, path + (name,)) for dependency in dependencies]
+        result = self.results[name] = render(*inputs)
+        self.render_counts[name] = self.render_counts.get(name, 0) + 1
+        return result
+
+    def dependents(self, name):
+        """Every node that depends on name, directly or transitively"""
+        found = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for other, (_, dependencies) in self.nodes.items():
+                if current in dependencies and other not in found:
+                    found.add(other)
+                    pending.append(other)
+        return found
+
+    def invalidate(self, name):
+        """Forget the results of name and of everything built from it"""
+        for stale in {name} | self.dependents(name):
+            self.results.pop(stale, None)
@@ -0,0 +1,135 @@
+"""
+x402 Protocol Pioneer Render Profile
+Opt-in wall-clock breakdown of the render code, by nested named sections:
+
+    with render_profile.section('trails'):
+        ...
+
+Sections nest, so time is recorded per stack (generate_gif:genesis >
+frames > shooting > x-streak > trails) and can be printed as a tree or
+written as a collapsed-stack file ("a;b;c <microseconds>" per line, self
+time) for flamegraph.pl, speedscope or inferno. cProfile can be run
+alongside for a function-level view.
+
+Off by default: section() then returns a shared no-op context manager, so
+an instrumented path costs one function call and an empty with block.
+Sections are recorded for the calling process only (not pool workers) and
+assume a single rendering thread.
+"""
+
+import cProfile
+import time
+from collections import defaultdict
+
+ENABLED = False
+
+# Open section names, innermost last
+_stack = []
+# Stack tuple -> [inclusive seconds, calls]
+_totals = defaultdict(lambda: [0.0, 0])
+_cprofile = None
+
+
+class _Section:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _stack.append(self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        total = _totals[tuple(_stack)]
+        total[0] += elapsed
+        total[1] += 1
+        _stack.pop()
+
+
+class _NoSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_SECTION = _NoSection()
+
+
+def section(name):
+    """Context manager timing a named section (a no-op unless profiling is enabled)"""
+    return _Section(name) if ENABLED else _NO_SECTION
+
+
+def enable(cprofile=False):
+    """Start recording sections (and cProfile too if cprofile=True)"""
+    global ENABLED, _cprofile
+    ENABLED = True
+    if cprofile and _cprofile is None:
+        _cprofile = cProfile.Profile()
+        _cprofile.enable()
+
+
+def disable():
+    """Stop recording; results are kept until reset()"""
+    global ENABLED
+    ENABLED = False
+    if _cprofile is not None:
+        _cprofile.disable()
+
+
+def reset():
+    """Forget every recorded section and cProfile result"""
+    global _cprofile
+    _totals.clear()
+    _stack.clear()
+    _cprofile = None
+
+
+def results():
+    """[(stack, inclusive seconds, self seconds, calls)] in tree order"""
+    children = defaultdict(float)
+    for stack, (seconds, _) in _totals.items():
+        if len(stack) > 1:
+            children[stack[:-1]] += seconds
+    return [
+        (stack, seconds, max(0.0, seconds - children[stack]), calls)
+        for stack, (seconds, calls) in sorted(_totals.items())
+    ]
+
+
+def print_report():
+    """Print the section tree with inclusive and self time"""
+    rows = results()
+    if not rows:
+        print("⏱️  No profile sections recorded")
+        return
+
+    print("⏱️  Render profile (wall time)")
+    print(f"   {'section':<44} {'total':>10} {'self':>10} {'calls':>7} {'per call':>10}")
+    for stack, seconds, self_seconds, calls in rows:
+        label = "  " * (len(stack) - 1) + stack[-1]
+        print(f"   {label:<44} {seconds * 1000:>8.1f}ms {self_seconds * 1000:>8.1f}ms "
+              f"{calls:>7} {seconds / calls * 1000:>8.2f}ms")
+
+
+def write_collapsed(path):
+    """Write self time per stack in collapsed-stack format (microseconds)"""
+    with open(path, 'w') as f:
+        for stack, _, self_seconds, _ in results():
+            microseconds = int(round(self_seconds * 1e6))
+            if microseconds:
+                f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def write_cprofile(path):
+    """Write cProfile stats (pstats format) if cProfile was enabled; returns True if written"""
+    if _cprofile is None:
+        return False
+    _cprofile.dump_stats(path)
+    return True
@@ -0,0 +1,297 @@
+"""
+x402 Protocol Pioneer Render Service
+Small asyncio HTTP server that renders token artwork on demand:
+
+    GET /render/{tokenId}.png   static image (create_static_nft template + label)
+    GET /render/{tokenId}.gif   animation (draw_frame frames + label)
+    GET /healthz                liveness and cache statistics
+
+Rendered bytes are kept in a size-bounded LRU memory cache backed by a disk
+cache keyed by a hash of the renderer sources, fonts and Pillow version, so
+restarts are warm and a renderer change never serves stale artwork. Every
+response carries a strong ETag and conditional GETs (If-None-Match) get a
+304. Concurrent requests for the same token share one render. Standard
+library only - rendering runs on a thread pool so the event loop stays free,
+one render at a time (the renderers' caches are shared and not thread-safe).
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import asset_manifest
+import font_registry
+from token_assets import MAX_SUPPLY, create_token_image, iter_token_frames, tier_frames, rarity_tier
+
+DEFAULT_CACHE_DIR = ".render-cache"
+DEFAULT_MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'gif': 'image/gif'
+}
+
+ROUTE = re.compile(r'^/render/(\d+)\.(png|gif)$')
+
+# Requests larger than this (request line + headers) are rejected
+MAX_HEADER_BYTES = 16 * 1024
+
+# Request bodies (never used) up to this size are skipped on a keep-alive
+# connection; a larger or chunked body closes it instead
+MAX_DRAINED_BODY_BYTES = 64 * 1024
+
+# Renders share the lru_cached fonts, tier templates and tier frames with
+# their GIF block caches (and the frame renderers' layer caches are not
+# thread-safe), so renders run one at a time; PNG encoding works on the
+# token's own image, outside the lock
+RENDER_LOCK = threading.Lock()
+
+
+def render_token_bytes(token_id, fmt):
+    """Encoded artwork for one token in fmt ('png' or 'gif')"""
+    buf = io.BytesIO()
+    if fmt == 'png':
+        with RENDER_LOCK:
+            img = create_token_image(token_id)
+        img.save(buf, 'PNG')
+    else:
+        from gif_stream import write_gif
+
+        with RENDER_LOCK:
+            _, block_cache = tier_frames(rarity_tier(token_id))
+            write_gif(buf, iter_token_frames(token_id), duration=50, loop=0, block_cache=block_cache)
+    return buf.getvalue()
+
+
+def renderer_version():
+    """Hash of everything token artwork depends on (sources, tiers, fonts, Pillow)"""
+    from PIL import __version__ as pillow_version
+
+    module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'token_assets.py')
+    inputs = asset_manifest.ScriptInputs(module_path, font_registry.resolved_font_paths(), pillow_version)
+    return inputs.inputs_hash()[:16]
+
+
+class RenderCache:
+    """LRU of rendered bytes bounded by total size, over a disk cache directory"""
+
+    def __init__(self, max_bytes=DEFAULT_MEMORY_CACHE_BYTES, cache_dir=DEFAULT_CACHE_DIR, version=''):
+        self.max_bytes = max_bytes
+        self.cache_dir = os.path.join(cache_dir, version) if cache_dir else None
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key):
+        token_id, fmt = key
+        return os.path.join(self.cache_dir, fmt, f"{token_id}.{fmt}")
+
+    def get(self, key):
+        """(body, etag) from memory or disk, or None"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                body = None
+            if body is not None:
+                self.disk_hits += 1
+                return self._remember(key, body)
+
+        return None
+
+    def put(self, key, body):
+        """Store freshly rendered bytes in memory and on disk, returning (body, etag)"""
+        if self.cache_dir:
+            path = self._disk_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(body)
+            os.replace(temp_path, path)
+        return self._remember(key, body)
+
+    def _remember(self, key, body):
+        entry = (body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+        if len(body) > self.max_bytes:
+            return entry
+
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[0])
+        self.entries[key] = entry
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+        return entry
+
+    def stats(self):
+        return {
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses
+        }
+
+
+class RenderService:
+    """HTTP/1.1 (keep-alive) front end for on-demand token rendering"""
+
+    def __init__(self, cache, workers=None, max_age=3600):
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.max_age = max_age
+        self.in_flight = {}
+
+    async def artwork(self, token_id, fmt):
+        """(body, etag) for a token, rendering at most once however many requests wait"""
+        key = (token_id, fmt)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+
+        future = self.in_flight.get(key)
+        if future is None:
+            # Only a request that starts a render is a miss; the rest join it
+            self.cache.misses += 1
+            future = asyncio.ensure_future(self._render(key))
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+
+        # Shielded so a disconnecting client doesn't cancel the render others wait for
+        return await asyncio.shield(future)
+
+    async def _render(self, key):
+        """Render and cache a token's artwork; run once per in-flight key, and the only writer"""
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(self.executor, render_token_bytes, *key)
+        return self.cache.put(key, body)
+
+    async def handle(self, method, path, headers):
+        """Response (status, headers, body) for one request"""
+        if method not in ('GET', 'HEAD'):
+            return HTTPStatus.METHOD_NOT_ALLOWED, {'Allow': 'GET, HEAD'}, b''
+
+        path = path.split('?', 1)[0]
+        if path == '/healthz':
+            body = json.dumps({'status': 'ok', 'cache': self.cache.stats()}).encode()
+            return HTTPStatus.OK, {'Content-Type': 'application/json', 'Cache-Control': 'no-store'}, body
+
+        match = ROUTE.match(path)
+        if not match:
+            return HTTPStatus.NOT_FOUND, {'Content-Type': 'text/plain'}, b'Not found\n'
+
+        token_id, fmt = int(match.group(1)), match.group(2)
+        if not 0 < token_id <= MAX_SUPPLY:
+            return HTTPStatus.NOT_FOUND, {'Content-Type': 'text/plain'}, b'Invalid token ID\n'
+
+        body, etag = await self.artwork(token_id, fmt)
+        response_headers = {
+            'ETag': etag,
+            'Cache-Control': f'public, max-age={self.max_age}'
+        }
+
+        if_none_match = headers.get('if-none-match', '')
+        if etag in (tag.strip() for tag in if_none_match.split(',')) or if_none_match.strip() == '*':
+            return HTTPStatus.NOT_MODIFIED, response_headers, b''
+
+        response_headers['Content-Type'] = CONTENT_TYPES[fmt]
+        return HTTPStatus.OK, response_headers, body
+
+    async def serve_connection(self, reader, writer):
+        """Handle requests on one connection until it closes"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, path, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 'HEAD', HTTPStatus.BAD_REQUEST, {}, b'', False)
+                    break
+
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+                if keep_alive and not await self._skip_body(reader, headers):
+                    keep_alive = False
+
+                try:
+                    status, response_headers, body = await self.handle(method, path, headers)
+                except Exception as e:
+                    status, response_headers, body = HTTPStatus.INTERNAL_SERVER_ERROR, {'Content-Type': 'text/plain'}, f"{e}\n".encode()
+
+                await self._respond(writer, method, status, response_headers, body, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _skip_body(self, reader, headers):
+        """Read and discard a request's body; False if the connection can't be reused after it"""
+        if 'transfer-encoding' in headers:
+            return False
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            return False
+        if not 0 <= length <= MAX_DRAINED_BODY_BYTES:
+            return False
+        if length:
+            try:
+                await reader.readexactly(length)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return False
+        return True
+
+    async def _respond(self, writer, method, status, headers, body, keep_alive):
+        head = [f"HTTP/1.1 {status.value} {status.phrase}"]
+        headers = dict(headers)
+        headers['Content-Length'] = str(len(body))
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        if method != 'HEAD':
+            writer.write(body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(host='127.0.0.1', port=8402, cache_dir=DEFAULT_CACHE_DIR,
+                memory_cache_bytes=DEFAULT_MEMORY_CACHE_BYTES, workers=None, ready=None):
+    """Run the render service until cancelled (ready(server) is called once listening)"""
+    cache = RenderCache(memory_cache_bytes, cache_dir, renderer_version())
+    service = RenderService(cache, workers)
+    server = await asyncio.start_server(service.serve_connection, host, port, limit=MAX_HEADER_BYTES)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,147 @@
+"""
+x402 Protocol Pioneer Text Effects
+Outlines and shadows for text, built from a single rasterised mask instead
+of stamping the text once per offset. The outline is a square dilation of
+the mask (separable, O(log width) image operations per axis, so a wider
+stroke costs about the same) and the shadow is an offset, optionally
+spread and blurred, copy of the same mask. reveal_text types text out
+incrementally, re-rendering only around the newly revealed glyphs.
+
+Usage:
+    draw_text(img, (x, y), "x402", font, WHITE, outline=BLUE, outline_width=2)
+    draw_text(img, (x, y), "x402", font, WHITE, shadow=GRAY_100, shadow_offset=(3, 3), shadow_blur=2)
+"""
+
+import functools
+import math
+
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont
+
+
+def text_mask(text, font, padding=0):
+    """
+    Rasterise text once as an 'L' mask
+    Returns (mask, (dx, dy)): the mask's top-left corner relative to the
+    position the text would be drawn at with ImageDraw.text. padding adds
+    empty pixels on every side, for outlines and blur to grow into.
+    """
+    left, top, right, bottom = ImageDraw.Draw(Image.new('L', (1, 1))).textbbox((0, 0), text, font=font)
+    mask = Image.new('L', (right - left + 2 * padding, bottom - top + 2 * padding), 0)
+    ImageDraw.Draw(mask).text((padding - left, padding - top), text, font=font, fill=255)
+    return mask, (left - padding, top - padding)
+
+
+def _shift(mask, dx, dy):
+    """mask moved by (dx, dy), with the vacated pixels empty"""
+    shifted = Image.new('L', mask.size, 0)
+    shifted.paste(mask, (dx, dy))
+    return shifted
+
+
+def _max_window(mask, radius, horizontal):
+    """
+    Maximum over a centred window of 2 * radius + 1 pixels along one axis
+    The mask needs radius empty pixels on each side along that axis.
+    """
+    def shift(img, distance):
+        return _shift(img, distance, 0) if horizontal else _shift(img, 0, distance)
+
+    width = 2 * radius + 1
+    result = shift(mask, -radius)
+    span = 1
+    # result covers offsets [0, span); doubling keeps the operation count logarithmic
+    while span * 2 <= width:
+        result = ImageChops.lighter(result, shift(result, span))
+        span *= 2
+    if span < width:
+        result = ImageChops.lighter(result, shift(result, width - span))
+    return result
+
+
+def dilate(mask, radius):
+    """
+    Square dilation of an 'L' mask: every pixel takes the maximum within radius
+    The result keeps the mask's size, so pad the mask (see text_mask) for
+    the outline to fit.
+    """
+    if radius <= 0:
+        return mask
+
+    padded = Image.new('L', (mask.width + 2 * radius, mask.height + 2 * radius), 0)
+    padded.paste(mask, (radius, radius))
+    grown = _max_window(_max_window(padded, radius, True), radius, False)
+    return grown.crop((radius, radius, radius + mask.width, radius + mask.height))
+
+
+def draw_text(img, xy, text, font, fill, outline=None, outline_width=0,
+              shadow=None, shadow_offset=(0, 0), shadow_blur=0, shadow_spread=0):
+    """
+    Draw text onto img (in place) with an optional outline and shadow
+    xy is the position ImageDraw.text would take. The layers are composited
+    shadow, outline, text - each a solid colour through the one mask.
+    """
+    padding = max(outline_width, shadow_spread) + 3 * int(shadow_blur + 0.5)
+    mask, (dx, dy) = text_mask(text, font, padding)
+    x, y = int(xy[0]) + dx, int(xy[1]) + dy
+
+    if shadow is not None:
+        shadow_mask = dilate(mask, shadow_spread)
+        if shadow_blur:
+            shadow_mask = shadow_mask.filter(ImageFilter.GaussianBlur(shadow_blur))
+        img.paste(shadow, (x + shadow_offset[0], y + shadow_offset[1]), shadow_mask)
+
+    if outline is not None and outline_width > 0:
+        img.paste(outline, (x, y), dilate(mask, outline_width))
+
+    img.paste(fill, (x, y), mask)
+
+
+def supports_reveal(font):
+    """
+    Whether reveal_text matches ImageDraw.text for font: glyphs must be
+    laid out one after another (basic layout; shaping can change earlier
+    glyphs when more text follows)
+    """
+    return isinstance(font, ImageFont.FreeTypeFont) and font.layout_engine == ImageFont.Layout.BASIC
+
+
+@functools.lru_cache(maxsize=256)
+def _glyph_layout(text, font):
+    """(pen x, ink box) of every glyph where ImageDraw.text((0, 0), text) puts it"""
+    layout = []
+    for index in range(len(text)):
+        # Advance up to and including the glyph, less its own: kerning with the previous glyph included
+        pen = font.getlength(text[:index + 1]) - font.getlength(text[index])
+        left, top, right, bottom = font.getbbox(text[index])
+        layout.append((pen, (pen + left, top, pen + right, bottom)))
+    return layout
+
+
+def reveal_text(img, below, xy, text, shown, revealed, font, fill):
+    """
+    Update img (in place) from text[:shown] to text[:revealed] drawn at xy
+    img must be below with text[:shown] drawn over it. Only the box of the
+    new glyphs is redrawn: from below, with every glyph that reaches into
+    it, so the result is identical to drawing text[:revealed] over below.
+    Needs supports_reveal(font).
+    """
+    layout = _glyph_layout(text, font)
+    x, y = xy
+    boxes = [box for _, box in layout[shown:revealed] if box[2] > box[0] and box[3] > box[1]]  # Spaces have no ink
+    if not boxes:
+        return
+
+    # Whole pixels around the new ink, with a pixel to spare
+    x0 = max(0, math.floor(x + min(box[0] for box in boxes)) - 1)
+    y0 = max(0, math.floor(y + min(box[1] for box in boxes)) - 1)
+    x1 = min(img.width, math.ceil(x + max(box[2] for box in boxes)) + 1)
+    y1 = min(img.height, math.ceil(y + max(box[3] for box in boxes)) + 1)
+    if x1 <= x0 or y1 <= y0:
+        return
+
+    # Earlier glyphs reaching into the box are redrawn with the new ones
+    first = next((index for index in range(shown) if x + layout[index][1][2] > x0), shown)
+
+    region = below.crop((x0, y0, x1, y1))
+    ImageDraw.Draw(region).text((x + layout[first][0] - x0, y - y0), text[first:revealed], fill=fill, font=font)
+    img.paste(region, (x0, y0))
@@ -0,0 +1,169 @@
+"""
+x402 Protocol Pioneer Token Assets
+Numbered per-token images for every token ID. The rarity tier follows mint
+order exactly as getRarityTier in contracts/X402ProtocolPioneers.sol. Each
+tier's artwork is rendered once per process and reused as a template, so a
+token only costs a copy, its "#id" label and the encode. Tokens are written
+in parallel across processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from PIL import ImageDraw
+
+import font_registry
+
+# Default output directory
+OUTPUT_DIR = "public/images/tokens"
+
+# Mirrors MAX_SUPPLY and getRarityTier in contracts/X402ProtocolPioneers.sol:
+# (last token ID of the tier, tier key), in mint order
+MAX_SUPPLY = 402
+RARITY_TIERS = [
+    (10, 'genesis'),
+    (100, 'pioneer'),
+    (225, 'early-adopter'),
+    (MAX_SUPPLY, 'protocol-user')
+]
+
+# Token label - top right, clear of the request code and protocol name
+LABEL_FONT_SIZE = 20
+LABEL_MARGIN = 20
+LABEL_Y = 45
+
+
+def rarity_tier(token_id):
+    """Tier key for a token ID (1..MAX_SUPPLY), by mint order"""
+    if not 0 < token_id <= MAX_SUPPLY:
+        raise ValueError(f"Token ID {token_id} out of range (1-{MAX_SUPPLY})")
+    for last_id, tier_key in RARITY_TIERS:
+        if token_id <= last_id:
+            return tier_key
+
+
+def parse_token_ids(value):
+    """Token IDs from a spec like 'all', '7' or '1-10,42'"""
+    if value.strip() == 'all':
+        return list(range(1, MAX_SUPPLY + 1))
+
+    token_ids = []
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = (int(bound) for bound in part.split('-', 1))
+            token_ids.extend(range(first, last + 1))
+        else:
+            token_ids.append(int(part))
+
+    for token_id in token_ids:
+        rarity_tier(token_id)  # Validate the range
+    return sorted(set(token_ids))
+
+
+def token_label(token_id):
+    return f"#{token_id}"
+
+
+def draw_token_label(img, token_id, color):
+    """Draw the token's "#id" label onto img (in place)"""
+    draw = ImageDraw.Draw(img)
+    draw.text(
+        (img.width - LABEL_MARGIN, LABEL_Y),
+        token_label(token_id),
+        fill=color,
+        font=font_registry.get_font(LABEL_FONT_SIZE),
+        anchor='ra'
+    )
+
+
+@lru_cache(maxsize=None)
+def tier_template(tier_key):
+    """Static tier artwork, rendered once per process"""
+    from tier_image import create_static_nft, tiers
+    return create_static_nft(tiers[tier_key], tier_key)
+
+
+@lru_cache(maxsize=len(RARITY_TIERS))
+def tier_frames(tier_key):
+    """Tier animation frames and a GIF block cache, built once per process for each tier
+
+    Frame changes away from the label encode identically for every token of
+    the tier, so the shared block cache means only the first frame and the
+    changes that touch the label are quantised per token. Every tier is kept
+    (about 75MB of frames each, 300MB for all four) so that requests
+    alternating between tiers don't re-render whole animations.
+    """
+    from tier_animation import draw_frame, tiers
+    return tuple(draw_frame(tiers[tier_key], frame) for frame in range(100)), {}
+
+
+def create_token_image(token_id):
+    """Static image for one token: its tier's template plus the token label"""
+    from tier_image import hex_to_rgb, tiers
+
+    tier_key = rarity_tier(token_id)
+    img = tier_template(tier_key).copy()
+    draw_token_label(img, token_id, hex_to_rgb(tiers[tier_key]['accent_color']))
+    return img
+
+
+def iter_token_frames(token_id):
+    """Animation frames for one token: its tier's frames plus the token label"""
+    from tier_animation import hex_to_rgb, tiers
+
+    tier_key = rarity_tier(token_id)
+    color = hex_to_rgb(tiers[tier_key]['code_color'])
+    frames, _ = tier_frames(tier_key)
+    for frame in frames:
+        frame = frame.copy()
+        draw_token_label(frame, token_id, color)
+        yield frame
+
+
+def render_token(token_id, output_dir=OUTPUT_DIR, gif=False):
+    """Write one token's PNG (and GIF if gif=True), returning the paths written"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    png_path = os.path.join(output_dir, f"{token_id}.png")
+    create_token_image(token_id).save(png_path, 'PNG')
+    paths = [png_path]
+
+    if gif:
+        from gif_stream import write_gif
+
+        gif_path = os.path.join(output_dir, f"{token_id}.gif")
+        _, block_cache = tier_frames(rarity_tier(token_id))
+        write_gif(gif_path, iter_token_frames(token_id), duration=50, loop=0, block_cache=block_cache)
+        paths.append(gif_path)
+
+    return paths
+
+
+def _render_token_job(args):
+    """Process pool entry point: render_token((token_id, output_dir, gif))"""
+    return render_token(*args)
+
+
+def render_tokens(token_ids, output_dir=OUTPUT_DIR, gif=False, workers=None):
+    """Render many tokens, in parallel when workers > 1 (None = one per CPU)
+
+    Yields (token_id, paths) in token order. Consecutive token IDs share a
+    tier, so each worker gets contiguous chunks and renders every tier
+    template it needs only once.
+    """
+    token_ids = list(token_ids)
+    jobs = [(token_id, output_dir, gif) for token_id in token_ids]
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for token_id, job in zip(token_ids, jobs):
+            yield token_id, _render_token_job(job)
+        return
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from zip(token_ids, executor.map(_render_token_job, jobs, chunksize=chunksize))